@@ -19,14 +19,31 @@ Usage:
 """
 
 import argparse
-import json
+import asyncio
+import dataclasses
+import functools
+import logging
 import os
+import random
 import re
+import sqlite3
+import subprocess
 import sys
+import time
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright, Page, Browser
+import httpx
+import orjson
+from playwright.async_api import async_playwright
+from playwright.sync_api import (
+    sync_playwright,
+    Page,
+    Browser,
+    Error as PlaywrightError,
+    TimeoutError as PlaywrightTimeoutError,
+)
 from rich.console import Console
+from rich.logging import RichHandler
 from rich.panel import Panel
 from rich.progress import (
     Progress,
@@ -35,35 +52,289 @@ from rich.progress import (
     BarColumn,
     TaskProgressColumn,
 )
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
-from scraper import Recipe, save_recipes
+from scraper import Recipe, format_duration, save_recipes
 
 console = Console()
+log = logging.getLogger(__name__)
 
 # Directory to store browser state (cookies, localStorage, etc.)
 STATE_DIR = Path(__file__).parent / ".browser_state"
 STATE_FILE = STATE_DIR / "state.json"
 
+# Persistent Chrome profile shared by every run over the DevTools protocol
+PROFILE_DIR = STATE_DIR / "profile"
+CDP_PORT = 9222
+CDP_ENDPOINT = f"http://localhost:{CDP_PORT}"
+
+SAVES_PAGE_URL = "https://www.foodnetwork.com/saves#/?section=recipes&sort=newest"
+
+# Title and href of every card on the saves page, read in one round trip
+SAVED_CARD_SELECTOR = "a.cards__card-link"
+SAVED_CARDS_JS = """els => els.map(a => ({
+    title: a.querySelector('.card__title, h2')?.innerText.trim() || '',
+    url: a.href,
+}))"""
+
+# True once the last card on the saves page differs from the one passed in,
+# i.e. scrolling has rendered new cards (appended or recycled)
+CARDS_CHANGED_JS = """([selector, last]) => {
+    const cards = document.querySelectorAll(selector);
+    return cards.length > 0 && cards[cards.length - 1].href !== last;
+}"""
+
+# True once the search filter has narrowed the card list
+CARDS_FILTERED_JS = """([selector, count]) =>
+    document.querySelectorAll(selector).length < count"""
+
+SEARCH_ICON_SELECTOR = '.actions--right__search-icon, [class*="search-icon"]'
+SEARCH_INPUT_SELECTOR = "#search, input.search__input"
+
+JSON_LD_SELECTOR = 'script[type="application/ld+json"]'
+
+# Returns the first schema.org Recipe object in the page's JSON-LD, as a JSON
+# string so it can be memoized by parse_json_ld_cached
+JSON_LD_RECIPE_JS = """() => {
+    const scripts = document.querySelectorAll('script[type="application/ld+json"]');
+    for (const script of scripts) {
+        try {
+            const data = JSON.parse(script.textContent);
+            if (Array.isArray(data)) {
+                for (const item of data) {
+                    if (item['@type'] === 'Recipe') return JSON.stringify(item);
+                }
+            } else if (data['@type'] === 'Recipe') {
+                return JSON.stringify(data);
+            } else if (data['@graph']) {
+                for (const item of data['@graph']) {
+                    if (item['@type'] === 'Recipe') return JSON.stringify(item);
+                }
+            }
+        } catch (e) {}
+    }
+    return null;
+}"""
+
+# Installed once per context as an init script, so each recipe page only
+# sends a short call instead of the whole extractor source
+JSON_LD_INIT_SCRIPT = f"window.__extractRecipeJsonLd = {JSON_LD_RECIPE_JS};"
+JSON_LD_EXTRACT_CALL = "window.__extractRecipeJsonLd()"
+
+# Matches JSON-LD script blocks in raw HTML for the no-browser fetch path
+JSON_LD_SCRIPT_RE = re.compile(
+    r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>', re.S | re.I
+)
+
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "br, gzip",
+}
+
+# Plain HTTP fetches in flight at once
+HTTP_CONCURRENCY = 20
+
+# Every fetch goes to the same host, so keep the connections warm and let
+# HTTP/2 multiplex the concurrent requests over them
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=HTTP_CONCURRENCY, max_connections=HTTP_CONCURRENCY
+)
+
+BROWSER_ARGS = ["--disable-blink-features=AutomationControlled"]
+
+# Resource types and third-party hosts that never affect the recipe data
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+BLOCKED_DOMAINS = (
+    "doubleclick",
+    "googletagmanager",
+    "google-analytics",
+    "googlesyndication",
+    "adservice",
+    "scorecardresearch",
+    "amazon-adsystem",
+    "connect.facebook.net",
+    "taboola",
+    "outbrain",
+    "chartbeat",
+    "moatads",
+    "adsafeprotected",
+)
+
+# schema.org NutritionInformation property -> label
+NUTRITION_FIELDS = (
+    ("calories", "Calories"),
+    ("fatContent", "Fat"),
+    ("saturatedFatContent", "Saturated Fat"),
+    ("cholesterolContent", "Cholesterol"),
+    ("sodiumContent", "Sodium"),
+    ("carbohydrateContent", "Carbohydrates"),
+    ("fiberContent", "Fiber"),
+    ("sugarContent", "Sugar"),
+    ("proteinContent", "Protein"),
+)
+
+# Every recipe ever scraped, keyed by URL, so reruns (into any output
+# directory) only fetch what's new - bypass with --no-cache
+CACHE_FILE = STATE_DIR / "cache.sqlite"
+# URLs looked up per query - SQLite allows at most 999 bound variables in
+# older builds
+CACHE_LOOKUP_BATCH = 500
+
+# Phase 2 appends each recipe here as it's scraped, so reruns can resume
+CHECKPOINT_FILE = "recipes.jsonl"
+CHECKPOINT_FLUSH_EVERY = 16
+
+# Pages scraped at once in Phase 2 - kept low to stay polite to one host
+DEFAULT_CONCURRENCY = 8
+
 
 def get_browser(playwright, headless: bool = True) -> Browser:
     """Launch browser with appropriate settings."""
-    return playwright.chromium.launch(
-        headless=headless,
-        args=[
-            "--disable-blink-features=AutomationControlled",
-        ],
+    return playwright.chromium.launch(headless=headless, args=BROWSER_ARGS)
+
+
+def should_block(request) -> bool:
+    """Whether a request is for imagery, fonts, styling or ad/analytics."""
+    return request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        domain in request.url for domain in BLOCKED_DOMAINS
     )
 
 
+def block_resources(route):
+    """Route handler that aborts requests the scraper doesn't need."""
+    if should_block(route.request):
+        route.abort()
+    else:
+        route.continue_()
+
+
+async def block_resources_async(route):
+    """Async counterpart of block_resources."""
+    if should_block(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def launch_cdp_chrome(playwright, headless: bool = True):
+    """Start a long-lived Chrome on the scraper profile with remote debugging."""
+    STATE_DIR.mkdir(exist_ok=True)
+    command = [
+        os.environ.get("CHROME_PATH") or playwright.chromium.executable_path,
+        f"--user-data-dir={PROFILE_DIR}",
+        f"--remote-debugging-port={CDP_PORT}",
+        "--no-first-run",
+        *BROWSER_ARGS,
+    ]
+    if headless:
+        command.append("--headless=new")
+
+    # Detached so it outlives this process and later runs can attach to it
+    subprocess.Popen(
+        command,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def connect_or_launch_cdp(playwright, headless: bool = True) -> Browser:
+    """
+    Attach to the persistent Chrome, starting it first if it isn't running.
+
+    Skips the cold start of a fresh browser on every command, and the
+    profile keeps the logged-in session between runs.
+    """
+    try:
+        return playwright.chromium.connect_over_cdp(CDP_ENDPOINT)
+    except PlaywrightError:
+        pass
+
+    console.print("[dim]Starting persistent browser...[/dim]")
+    launch_cdp_chrome(playwright, headless=headless)
+
+    for _ in range(20):
+        time.sleep(0.5)
+        try:
+            return playwright.chromium.connect_over_cdp(CDP_ENDPOINT)
+        except PlaywrightError:
+            continue
+
+    console.print("[yellow]Persistent browser unavailable, launching one-off[/yellow]")
+    return get_browser(playwright, headless=headless)
+
+
+async def connect_or_launch_cdp_async(playwright, headless: bool = True):
+    """Async counterpart of connect_or_launch_cdp."""
+    try:
+        return await playwright.chromium.connect_over_cdp(CDP_ENDPOINT)
+    except PlaywrightError:
+        pass
+
+    console.print("[dim]Starting persistent browser...[/dim]")
+    launch_cdp_chrome(playwright, headless=headless)
+
+    for _ in range(20):
+        await asyncio.sleep(0.5)
+        try:
+            return await playwright.chromium.connect_over_cdp(CDP_ENDPOINT)
+        except PlaywrightError:
+            continue
+
+    console.print("[yellow]Persistent browser unavailable, launching one-off[/yellow]")
+    return await playwright.chromium.launch(headless=headless, args=BROWSER_ARGS)
+
+
+def release_browser(browser: Browser, page: Page):
+    """Close our tab and disconnect, leaving a persistent Chrome running."""
+    page.close()
+    browser.close()
+
+
 def get_context(browser: Browser, state_file: Path = STATE_FILE):
-    """Create browser context, loading saved state if available."""
+    """
+    Get a browser context, loading saved state if available.
+
+    A browser attached over CDP already has the persistent profile's
+    context, which is reused as-is.
+    """
     STATE_DIR.mkdir(exist_ok=True)
 
-    if state_file.exists():
+    if browser.contexts:
+        context = browser.contexts[0]
+    elif state_file.exists():
         console.print("[dim]Loading saved browser state...[/dim]")
-        return browser.new_context(storage_state=str(state_file))
+        context = browser.new_context(storage_state=str(state_file))
     else:
-        return browser.new_context()
+        context = browser.new_context()
+
+    context.route("**/*", block_resources)
+    context.add_init_script(JSON_LD_INIT_SCRIPT)
+    return context
+
+
+async def get_context_async(browser, state_file: Path = STATE_FILE):
+    """Async counterpart of get_context."""
+    STATE_DIR.mkdir(exist_ok=True)
+
+    if browser.contexts:
+        context = browser.contexts[0]
+    elif state_file.exists():
+        console.print("[dim]Loading saved browser state...[/dim]")
+        context = await browser.new_context(storage_state=str(state_file))
+    else:
+        context = await browser.new_context()
+
+    await context.route("**/*", block_resources_async)
+    await context.add_init_script(JSON_LD_INIT_SCRIPT)
+    return context
 
 
 def save_state(context, state_file: Path = STATE_FILE):
@@ -73,6 +344,137 @@ def save_state(context, state_file: Path = STATE_FILE):
     console.print(f"[green]✓ Browser state saved to {state_file}[/green]")
 
 
+def read_saved_cards(page: Page) -> list[tuple[str, str]]:
+    """Return (title, url) for every recipe card currently on the saves page."""
+    cards = page.eval_on_selector_all(SAVED_CARD_SELECTOR, SAVED_CARDS_JS)
+    return [
+        (card["title"], card["url"])
+        for card in cards
+        if card["title"]
+        and "Import" not in card["title"]
+        and "Create" not in card["title"]
+    ]
+
+
+def wait_for_cards(page: Page, timeout: int = 15000):
+    """Wait for the saves page to render its cards, giving up quietly."""
+    try:
+        page.wait_for_selector(SAVED_CARD_SELECTOR, timeout=timeout)
+    except PlaywrightTimeoutError:
+        pass  # Redirected to login, or no saves - callers check for both
+
+
+def scroll_saves_page(page: Page, timeout: int = 3000):
+    """Scroll the last card into view and wait until new cards render (or timeout)."""
+    last_url = page.eval_on_selector_all(
+        SAVED_CARD_SELECTOR,
+        """els => {
+            if (!els.length) return null;
+            const last = els[els.length - 1];
+            last.scrollIntoView({block: 'end'});
+            return last.href;
+        }""",
+    )
+    try:
+        page.wait_for_function(
+            CARDS_CHANGED_JS, arg=[SAVED_CARD_SELECTOR, last_url], timeout=timeout
+        )
+    except PlaywrightTimeoutError:
+        pass  # Nothing new loaded - the caller's no-new counter handles this
+
+
+def collect_all_saved_urls(page: Page) -> dict[str, str]:
+    """
+    Scroll through the whole saves page and harvest every recipe card.
+
+    Reads each card's title and href straight from the DOM after every
+    scroll - no clicking through to the recipe and back again.
+
+    Returns:
+        Dict of recipe URL to card title, in page order
+    """
+    harvested = {}
+    no_new_count = 0
+
+    while no_new_count < 5:  # Each empty pass already waited 3s
+        found_new = False
+
+        for title, url in read_saved_cards(page):
+            if not url or "/recipes/" not in url or url in harvested:
+                continue
+
+            harvested[url] = title
+            found_new = True
+
+        if found_new:
+            no_new_count = 0
+            console.print(
+                f"[cyan]Collected {len(harvested)} URLs...[/cyan]",
+                end="\r",
+            )
+        else:
+            no_new_count += 1
+
+        # Scroll down to load more cards
+        scroll_saves_page(page)
+
+    console.print()
+    return harvested
+
+
+def search_saved_url(page: Page, title: str) -> str | None:
+    """Find a recipe's URL with the search box on the saves page."""
+    # Go to saves page fresh for each search
+    page.goto(SAVES_PAGE_URL, wait_until="domcontentloaded", timeout=15000)
+    wait_for_cards(page)
+
+    # Click the search icon to reveal search input
+    search_icon = page.query_selector(SEARCH_ICON_SELECTOR)
+    if search_icon:
+        search_icon.click()
+        try:
+            page.wait_for_selector(SEARCH_INPUT_SELECTOR, timeout=2000)
+        except PlaywrightTimeoutError:
+            pass
+
+    # Find and use the search input
+    search_input = page.query_selector(SEARCH_INPUT_SELECTOR)
+    if not search_input:
+        return None
+
+    card_count = page.eval_on_selector_all(SAVED_CARD_SELECTOR, "els => els.length")
+    search_input.fill(title)
+    # Wait for the filter to narrow the list
+    try:
+        page.wait_for_function(
+            CARDS_FILTERED_JS, arg=[SAVED_CARD_SELECTOR, card_count], timeout=1500
+        )
+    except PlaywrightTimeoutError:
+        pass
+
+    # Find matching card (case insensitive) and take its href
+    for card_title, url in read_saved_cards(page):
+        if card_title.lower() == title.lower():
+            return url
+    return None
+
+
+def wait_for_json_ld(page: Page, timeout: int = 5000):
+    """Wait for a JSON-LD block to be attached, if the page has one."""
+    try:
+        page.wait_for_selector(JSON_LD_SELECTOR, state="attached", timeout=timeout)
+    except PlaywrightTimeoutError:
+        pass  # Falls back to HTML parsing
+
+
+async def wait_for_json_ld_async(page, timeout: int = 5000):
+    """Async counterpart of wait_for_json_ld."""
+    try:
+        await page.wait_for_selector(JSON_LD_SELECTOR, state="attached", timeout=timeout)
+    except PlaywrightTimeoutError:
+        pass
+
+
 def do_login(args):
     """Open browser for user to log in manually."""
     console.print(
@@ -88,9 +490,11 @@ def do_login(args):
     )
 
     with sync_playwright() as p:
-        browser = get_browser(p, headless=False)
-        context = browser.new_context()
-        page = context.new_page()
+        # Logging in here is what sets up the persistent profile
+        context = p.chromium.launch_persistent_context(
+            str(PROFILE_DIR), headless=False, args=BROWSER_ARGS
+        )
+        page = context.pages[0] if context.pages else context.new_page()
 
         # Go to Food Network login page
         page.goto("https://www.foodnetwork.com/")
@@ -106,7 +510,7 @@ def do_login(args):
 
         # Save state before closing
         save_state(context)
-        browser.close()
+        context.close()
 
     console.print("\n[green]✓ Login complete! You can now run:[/green]")
     console.print("  python browser_scraper.py scrape-saved")
@@ -115,31 +519,10 @@ def do_login(args):
 def extract_recipe_from_page(page: Page, url: str) -> Recipe:
     """Extract recipe data from a page."""
     # Try to get JSON-LD data first (most reliable)
-    json_ld_data = page.evaluate(
-        """() => {
-        const scripts = document.querySelectorAll('script[type="application/ld+json"]');
-        for (const script of scripts) {
-            try {
-                const data = JSON.parse(script.textContent);
-                if (Array.isArray(data)) {
-                    for (const item of data) {
-                        if (item['@type'] === 'Recipe') return item;
-                    }
-                } else if (data['@type'] === 'Recipe') {
-                    return data;
-                } else if (data['@graph']) {
-                    for (const item of data['@graph']) {
-                        if (item['@type'] === 'Recipe') return item;
-                    }
-                }
-            } catch (e) {}
-        }
-        return null;
-    }"""
-    )
+    json_ld_json = page.evaluate(JSON_LD_EXTRACT_CALL)
 
-    if json_ld_data:
-        return parse_json_ld(json_ld_data, url)
+    if json_ld_json:
+        return parse_json_ld_cached(url, json_ld_json)
 
     # Fallback to HTML parsing
     title = page.title() or "Untitled Recipe"
@@ -155,22 +538,395 @@ def extract_recipe_from_page(page: Page, url: str) -> Recipe:
     )
 
 
-def parse_json_ld(data: dict, url: str) -> Recipe:
-    """Parse recipe from JSON-LD data."""
+async def extract_recipe_from_page_async(page, url: str) -> Recipe:
+    """Async counterpart of extract_recipe_from_page."""
+    json_ld_json = await page.evaluate(JSON_LD_EXTRACT_CALL)
+
+    if json_ld_json:
+        return parse_json_ld_cached(url, json_ld_json)
+
+    title = await page.title() or "Untitled Recipe"
+    title_elem = await page.query_selector("h1")
+    if title_elem:
+        title = (await title_elem.inner_text()).strip()
 
-    def get_time(time_str):
-        if not time_str:
+    return Recipe(
+        title=title,
+        url=url,
+        ingredients=[],
+        instructions=[],
+    )
+
+
+def find_recipe_json_ld(html: str) -> dict | None:
+    """Find the schema.org Recipe object in raw HTML (mirrors JSON_LD_RECIPE_JS)."""
+    for match in JSON_LD_SCRIPT_RE.finditer(html):
+        try:
+            data = orjson.loads(match.group(1))
+        except ValueError:
+            continue
+
+        if isinstance(data, list):
+            for item in data:
+                if isinstance(item, dict) and item.get("@type") == "Recipe":
+                    return item
+        elif isinstance(data, dict):
+            if data.get("@type") == "Recipe":
+                return data
+            for item in data.get("@graph", []):
+                if isinstance(item, dict) and item.get("@type") == "Recipe":
+                    return item
+    return None
+
+
+def load_state_cookies(state_file: Path = STATE_FILE) -> httpx.Cookies:
+    """Load the saved Food Network session cookies for use with httpx."""
+    cookies = httpx.Cookies()
+    if state_file.exists():
+        state = orjson.loads(state_file.read_bytes())
+        # The profile also carries ad/analytics cookies for other domains,
+        # which would never be sent to the recipe pages
+        for cookie in state.get("cookies", []):
+            if "foodnetwork" in cookie.get("domain", ""):
+                cookies.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie["domain"],
+                    path=cookie.get("path", "/"),
+                )
+    return cookies
+
+
+def make_http_client() -> httpx.AsyncClient:
+    """HTTP/2 client carrying the saved session cookies, for fetch_recipe."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=HTTP_LIMITS,
+        headers=HTTP_HEADERS,
+        cookies=load_state_cookies(),
+        follow_redirects=True,
+        timeout=30,
+    )
+
+
+async def fetch_recipe(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str
+) -> Recipe | None:
+    """Fetch a recipe over plain HTTP, returning None if there's no JSON-LD."""
+    async with semaphore:
+        try:
+            response = await retry_transient(client.get)(url)
+        except httpx.HTTPError:
             return None
-        match = re.match(r"PT(?:(\d+)H)?(?:(\d+)M)?", time_str)
-        if match:
-            hours, minutes = match.groups()
-            parts = []
-            if hours:
-                parts.append(f"{hours}h")
-            if minutes:
-                parts.append(f"{minutes}m")
-            return " ".join(parts) if parts else None
-        return time_str
+
+    if response.status_code != 200:
+        return None
+
+    # Malformed JSON-LD shouldn't abort the other fetches - the page just
+    # falls back to the browser
+    try:
+        data = find_recipe_json_ld(response.text)
+        return parse_json_ld(data, url) if data else None
+    except Exception as e:
+        log.debug("Couldn't parse JSON-LD for %s: %r", url, e)
+        return None
+
+
+# Back off 0.5s, 1s (capped at 4s) between tries, and only retry errors
+# that are plausibly transient - anything else fails the recipe at once
+retry_transient = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.5, max=4),
+    retry=retry_if_exception_type((PlaywrightTimeoutError, httpx.TransportError)),
+    reraise=True,
+)
+
+
+@retry_transient
+async def fetch_recipe_with_retry(page, url: str) -> Recipe:
+    """Load a recipe page in the browser and extract it, retrying timeouts."""
+    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+    return await extract_recipe_from_page_async(page, url)
+
+
+async def scrape_with_browser(pending, record, failed, args, progress, task):
+    """
+    Render recipe pages that plain HTTP couldn't handle.
+
+    Opens a pool of pages in one authenticated context; each worker owns a
+    page and pulls (index, (title, url)) items from a shared queue, so the
+    network and render time of several recipes overlap. Each recipe is
+    handed to record(index, recipe) as soon as it's scraped.
+    """
+    queue = asyncio.Queue()
+    for item in pending:
+        queue.put_nowait(item)
+
+    async with async_playwright() as p:
+        # Phase 1 leaves the persistent Chrome running, so attach to it
+        try:
+            browser = await p.chromium.connect_over_cdp(CDP_ENDPOINT)
+            context = browser.contexts[0]
+        except PlaywrightError:
+            browser = await p.chromium.launch(
+                headless=not args.visible, args=BROWSER_ARGS
+            )
+            context = await browser.new_context(
+                storage_state=str(STATE_FILE) if STATE_FILE.exists() else None
+            )
+        await context.route("**/*", block_resources_async)
+        await context.add_init_script(JSON_LD_INIT_SCRIPT)
+
+        async def worker(page):
+            while not queue.empty():
+                index, (title, url) = queue.get_nowait()
+                progress.update(task, description=f"Scraping: {title[:30]}...")
+
+                # Jittered start so the workers don't hit the site in lockstep
+                await asyncio.sleep(random.uniform(0.1, 0.5))
+                try:
+                    recipe = await fetch_recipe_with_retry(page, url)
+                    recipe.title = title
+                    record(index, recipe)
+                except Exception as e:
+                    # Any failure - not just a browser error - fails only
+                    # this recipe, never the rest of the pool
+                    log.debug("Failed to scrape %s: %r", title, e)
+                    failed.append((title, url))
+
+                progress.advance(task)
+
+        # Open the whole pool up front; each page is reused for every recipe
+        # its worker handles
+        pages = await asyncio.gather(
+            *(context.new_page() for _ in range(min(args.concurrency, len(pending))))
+        )
+        try:
+            await asyncio.gather(*(worker(page) for page in pages))
+        finally:
+            for page in pages:
+                await page.close()
+
+        await browser.close()
+
+
+def load_checkpoint(path: Path) -> dict[str, Recipe]:
+    """Load recipes already streamed to a JSONL checkpoint, keyed by URL."""
+    done = {}
+    if path.exists():
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    recipe = Recipe(**orjson.loads(line))
+                except (ValueError, TypeError):
+                    continue  # Partial line from an interrupted run
+                done[recipe.url] = recipe
+    return done
+
+
+def clear_checkpoint(output_dir) -> None:
+    """
+    Remove the JSONL checkpoint once its recipes have been saved, so only an
+    unfinished run is resumed from it - not every later run.
+    """
+    (Path(output_dir) / CHECKPOINT_FILE).unlink(missing_ok=True)
+
+
+def open_cache(path: Path = CACHE_FILE) -> sqlite3.Connection:
+    """Open the per-URL recipe cache, creating it if needed."""
+    path.parent.mkdir(exist_ok=True)
+    db = sqlite3.connect(path)
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS recipes(url TEXT PRIMARY KEY, json TEXT, ts INTEGER)"
+    )
+    return db
+
+
+def load_cached_recipes(db: sqlite3.Connection, urls) -> dict[str, Recipe]:
+    """Look up cached recipes for the given URLs, keyed by URL."""
+    urls = list(urls)
+    cached = {}
+    # Primary-key lookups in batches under SQLite's bound-variable limit, so
+    # the cost follows the URLs asked for rather than the size of the cache
+    for start in range(0, len(urls), CACHE_LOOKUP_BATCH):
+        batch = urls[start:start + CACHE_LOOKUP_BATCH]
+        query = f"SELECT url, json FROM recipes WHERE url IN ({','.join('?' * len(batch))})"
+        for url, data in db.execute(query, batch):
+            try:
+                cached[url] = Recipe(**orjson.loads(data))
+            except (ValueError, TypeError):
+                continue  # Written by an older Recipe - just scrape it again
+    return cached
+
+
+def make_progress() -> Progress:
+    """Build the progress display shared by both phases of a command."""
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console,
+    )
+
+
+async def scrape_recipe_urls(
+    recipe_urls: list[tuple[str, str]], args, progress: Progress
+):
+    """
+    Scrape recipe pages concurrently.
+
+    Recipe pages carry their JSON-LD in the server-rendered HTML, so each
+    URL is first fetched over plain HTTP with the saved session cookies.
+    Only pages where that finds no Recipe fall back to a real browser.
+
+    Progress is reported as a new task on the caller's (already started)
+    progress display.
+
+    Every recipe is appended to a JSONL checkpoint in the output directory
+    as soon as it's scraped, and URLs already in it are skipped - so an
+    interrupted run picks up where it left off. Callers remove it with
+    clear_checkpoint once the recipes are saved. URLs in the recipe cache
+    (see CACHE_FILE) are skipped too. --no-cache ignores both, re-scraping
+    every URL and starting the checkpoint afresh.
+
+    Returns:
+        Tuple of (recipes in input order, list of failed (title, url) pairs)
+    """
+    results = [None] * len(recipe_urls)
+    failed = []
+
+    output_path = Path(args.output)
+    output_path.mkdir(parents=True, exist_ok=True)
+    checkpoint_path = output_path / CHECKPOINT_FILE
+    # --no-cache starts over: nothing is reused from a previous run
+    done = {} if args.no_cache else load_checkpoint(checkpoint_path)
+    checkpoint_mode = "wb" if args.no_cache else "ab"
+
+    todo = []
+    for index, (title, url) in enumerate(recipe_urls):
+        if url in done:
+            results[index] = done[url]
+        else:
+            todo.append((index, (title, url)))
+
+    if len(todo) < len(recipe_urls):
+        console.print(
+            f"[dim]Resuming: {len(recipe_urls) - len(todo)} recipes already in {checkpoint_path}[/dim]"
+        )
+
+    # Rows are committed with each checkpoint flush, and whatever is left
+    # when the run ends - even when it ends in an error, which is when the
+    # next run needs them most
+    cache = None if args.no_cache else open_cache()
+    try:
+        # Buffered, and only flushed every CHECKPOINT_FLUSH_EVERY recipes so the
+        # checkpoint doesn't cost a syscall per recipe
+        with open(checkpoint_path, checkpoint_mode, buffering=1 << 20) as checkpoint:
+            task = progress.add_task("Fetching recipes...", total=len(recipe_urls))
+            progress.advance(task, len(recipe_urls) - len(todo))
+
+            recorded = 0
+
+            def record(index, recipe):
+                nonlocal recorded
+                results[index] = recipe
+                line = orjson.dumps(
+                    dataclasses.asdict(recipe), option=orjson.OPT_APPEND_NEWLINE
+                )
+                checkpoint.write(line)
+                if cache:
+                    cache.execute(
+                        "INSERT OR REPLACE INTO recipes VALUES (?, ?, ?)",
+                        (recipe.url, line.decode(), int(time.time())),
+                    )
+                recorded += 1
+                if recorded % CHECKPOINT_FLUSH_EVERY == 0:
+                    checkpoint.flush()
+                    if cache:
+                        cache.commit()
+
+            if cache:
+                cached = load_cached_recipes(cache, (url for _, (_, url) in todo))
+                if cached:
+                    console.print(f"[dim]Using {len(cached)} cached recipes[/dim]")
+                uncached = []
+                for index, (title, url) in todo:
+                    if url in cached:
+                        recipe = cached[url]
+                        recipe.title = title
+                        record(index, recipe)
+                        progress.advance(task)
+                    else:
+                        uncached.append((index, (title, url)))
+                todo = uncached
+
+            pending = []
+            semaphore = asyncio.Semaphore(HTTP_CONCURRENCY)
+
+            async with make_http_client() as client:
+
+                async def fetch(index, title, url):
+                    recipe = await fetch_recipe(client, semaphore, url)
+                    if recipe:
+                        recipe.title = title
+                        record(index, recipe)
+                        progress.advance(task)
+                    else:
+                        pending.append((index, (title, url)))
+
+                await asyncio.gather(
+                    *(fetch(index, title, url) for index, (title, url) in todo)
+                )
+
+            if pending:
+                await scrape_with_browser(pending, record, failed, args, progress, task)
+
+            checkpoint.flush()
+            os.fsync(checkpoint.fileno())
+    finally:
+        if cache:
+            cache.commit()
+            cache.close()
+
+    return [r for r in results if r], failed
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_json_ld_json(url: str, data_json: str) -> Recipe:
+    return parse_json_ld(orjson.loads(data_json), url)
+
+
+def parse_json_ld_cached(url: str, data_json: str) -> Recipe:
+    """
+    Parse recipe from a JSON-LD string, memoized per URL and payload.
+
+    Retries of the same page reuse the earlier result. A copy is returned
+    since callers overwrite the title.
+    """
+    return dataclasses.replace(_parse_json_ld_json(url, data_json))
+
+
+def _first_value(value, key: str) -> str | None:
+    """Pull a name/url out of a JSON-LD string, object, or list of either."""
+    if isinstance(value, list):
+        if not value:
+            return None
+        value = value[0]
+        if not isinstance(value, dict):
+            return str(value)
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return value.get(key)
+    return None
+
+
+def parse_json_ld(data: dict, url: str) -> Recipe:
+    """Parse recipe from JSON-LD data."""
+    # Only plain fields are read, so never let anything resolve the
+    # (remote) schema.org context
+    data.pop("@context", None)
 
     def get_instructions(instructions):
         if not instructions:
@@ -205,50 +961,12 @@ def parse_json_ld(data: dict, url: str) -> Recipe:
     nutrition = {}
     if "nutrition" in data and isinstance(data["nutrition"], dict):
         nutrition_data = data["nutrition"]
-        nutrition_fields = [
-            ("calories", "Calories"),
-            ("fatContent", "Fat"),
-            ("saturatedFatContent", "Saturated Fat"),
-            ("cholesterolContent", "Cholesterol"),
-            ("sodiumContent", "Sodium"),
-            ("carbohydrateContent", "Carbohydrates"),
-            ("fiberContent", "Fiber"),
-            ("sugarContent", "Sugar"),
-            ("proteinContent", "Protein"),
-        ]
-        for field, label in nutrition_fields:
+        for field, label in NUTRITION_FIELDS:
             if field in nutrition_data:
                 nutrition[label] = nutrition_data[field]
 
-    author = None
-    if "author" in data:
-        author_data = data["author"]
-        if isinstance(author_data, str):
-            author = author_data
-        elif isinstance(author_data, dict):
-            author = author_data.get("name")
-        elif isinstance(author_data, list) and author_data:
-            first_author = author_data[0]
-            author = (
-                first_author.get("name")
-                if isinstance(first_author, dict)
-                else str(first_author)
-            )
-
-    image_url = None
-    if "image" in data:
-        image_data = data["image"]
-        if isinstance(image_data, str):
-            image_url = image_data
-        elif isinstance(image_data, dict):
-            image_url = image_data.get("url")
-        elif isinstance(image_data, list) and image_data:
-            first_image = image_data[0]
-            image_url = (
-                first_image.get("url")
-                if isinstance(first_image, dict)
-                else str(first_image)
-            )
+    author = _first_value(data.get("author"), "name")
+    image_url = _first_value(data.get("image"), "url")
 
     categories = []
     if "recipeCategory" in data:
@@ -264,9 +982,9 @@ def parse_json_ld(data: dict, url: str) -> Recipe:
         url=url,
         author=author,
         description=data.get("description"),
-        prep_time=get_time(data.get("prepTime")),
-        cook_time=get_time(data.get("cookTime")),
-        total_time=get_time(data.get("totalTime")),
+        prep_time=format_duration(data.get("prepTime")),
+        cook_time=format_duration(data.get("cookTime")),
+        total_time=format_duration(data.get("totalTime")),
         servings=data.get("recipeYield"),
         difficulty=data.get("difficulty"),
         ingredients=get_ingredients(data.get("recipeIngredient")),
@@ -280,20 +998,20 @@ def parse_json_ld(data: dict, url: str) -> Recipe:
 def scrape_single(args):
     """Scrape a single recipe using browser."""
     with sync_playwright() as p:
-        browser = get_browser(p, headless=not args.visible)
+        browser = connect_or_launch_cdp(p, headless=not args.visible)
         context = get_context(browser)
         page = context.new_page()
 
         console.print(f"[cyan]Scraping: {args.url}[/cyan]")
         page.goto(args.url, wait_until="domcontentloaded", timeout=15000)
-        page.wait_for_timeout(1500)  # Let JS render
+        wait_for_json_ld(page)
 
         recipe = extract_recipe_from_page(page, args.url)
         save_recipes([recipe], args.output)
 
         console.print(f"[green]✓ Saved: {recipe.title}[/green]")
 
-        browser.close()
+        release_browser(browser, page)
 
 
 def scrape_saved(args):
@@ -305,126 +1023,32 @@ def scrape_saved(args):
         sys.exit(1)
 
     with sync_playwright() as p:
-        browser = get_browser(p, headless=not args.visible)
+        browser = connect_or_launch_cdp(p, headless=not args.visible)
         context = get_context(browser)
         page = context.new_page()
 
-        saves_page_url = (
-            "https://www.foodnetwork.com/saves#/?section=recipes&sort=newest"
-        )
-
         console.print("[cyan]Loading saves page...[/cyan]")
         try:
-            page.goto(saves_page_url, wait_until="domcontentloaded", timeout=15000)
+            page.goto(SAVES_PAGE_URL, wait_until="domcontentloaded", timeout=15000)
         except Exception as e:
             console.print(f"[red]Navigation error: {e}[/red]")
-            browser.close()
+            release_browser(browser, page)
             sys.exit(1)
 
-        page.wait_for_timeout(4000)
+        wait_for_cards(page)
 
         if "login" in page.url.lower() or "sign-in" in page.url.lower():
             console.print(
                 "[yellow]Redirected to login - session may have expired.[/yellow]"
             )
             console.print("Run 'python browser_scraper.py login' to log in again.")
-            browser.close()
+            release_browser(browser, page)
             sys.exit(1)
 
-        # NEW APPROACH: Open each card in a new tab using Ctrl/Cmd+Click
-        # This preserves the main page scroll position (virtualized scrolling issue)
-
-        recipe_urls = []  # List of (title, url) tuples
-        seen_titles = set()
-        no_new_count = 0
-        scroll_position = 0
-
-        # Use request interception to capture URL when clicking
-        captured_url = []
-
-        def handle_request(request):
-            url = request.url
-            if "/recipes/" in url and "foodnetwork.com" in url:
-                captured_url.append(url)
-
-        page.on("request", handle_request)
-
         console.print("[cyan]Collecting recipe URLs...[/cyan]")
-
-        while no_new_count < 20:  # Patient scrolling
-            # Find ONE new card to process
-            cards = page.query_selector_all(".cards__card-link")
-            found_new = False
-
-            for card in cards:
-                try:
-                    title_elem = card.query_selector(".card__title, h2")
-                    if not title_elem:
-                        continue
-                    title_text = title_elem.inner_text().strip()
-                    if (
-                        not title_text
-                        or "Import" in title_text
-                        or "Create" in title_text
-                    ):
-                        continue
-                    if title_text in seen_titles:
-                        continue
-
-                    # Found a new card!
-                    seen_titles.add(title_text)
-                    found_new = True
-                    no_new_count = 0
-
-                    # Click the card to capture URL via request handler
-                    captured_url.clear()
-                    card.click()
-                    page.wait_for_timeout(400)  # Brief wait for request to fire
-
-                    if captured_url:
-                        recipe_urls.append((title_text, captured_url[0]))
-                        console.print(
-                            f"[cyan]Collected {len(recipe_urls)} URLs...[/cyan]",
-                            end="\r",
-                        )
-
-                    # Navigate back to saves page
-                    page.goto(
-                        saves_page_url,
-                        wait_until="domcontentloaded",
-                        timeout=15000,
-                    )
-                    page.wait_for_timeout(1500)
-
-                    # Scroll back to approximate position (cards ~120px each)
-                    target_scroll = len(recipe_urls) * 120
-                    page.evaluate(f"window.scrollTo(0, {target_scroll})")
-                    page.wait_for_timeout(800)
-
-                    # Break to re-query fresh cards
-                    break
-
-                except Exception as e:
-                    if args.debug:
-                        console.print(f"[yellow]Error: {e}[/yellow]")
-                    # Try to recover
-                    try:
-                        page.goto(
-                            saves_page_url, wait_until="domcontentloaded", timeout=15000
-                        )
-                        page.wait_for_timeout(1000)
-                    except:
-                        pass
-                    break
-
-            if not found_new:
-                no_new_count += 1
-                # Scroll down to load more cards
-                scroll_position += 500
-                page.evaluate(f"window.scrollTo(0, {scroll_position})")
-                page.wait_for_timeout(800)
-
-        console.print()
+        recipe_urls = [
+            (title, url) for url, title in collect_all_saved_urls(page).items()
+        ]
         console.print(f"[green]Collected {len(recipe_urls)} recipe URLs![/green]")
 
         if not recipe_urls:
@@ -432,71 +1056,34 @@ def scrape_saved(args):
             console.print(
                 "[dim]Make sure you have saved recipes and are properly logged in.[/dim]"
             )
-            browser.close()
+            release_browser(browser, page)
             sys.exit(1)
 
-        if args.limit:
-            recipe_urls = recipe_urls[: args.limit]
-
-        # PHASE 2: Scrape each recipe URL directly
-        console.print(f"\n[cyan]Phase 2: Scraping {len(recipe_urls)} recipes...[/cyan]")
-
-        recipes = []
-        failed = []
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Scraping recipes...", total=len(recipe_urls))
-
-            for title, url in recipe_urls:
-                progress.update(task, description=f"Scraping: {title[:30]}...")
+        # Save updated state so the Phase 2 context starts from a fresh session
+        save_state(context)
+        release_browser(browser, page)
 
-                # Try up to 3 times with increasing wait
-                success = False
-                for attempt in range(3):
-                    try:
-                        # Navigate with longer timeout
-                        page.goto(url, wait_until="load", timeout=30000)
-                        page.wait_for_timeout(2000)  # Let page fully settle
+    if args.limit:
+        recipe_urls = recipe_urls[: args.limit]
 
-                        recipe = extract_recipe_from_page(page, url)
-                        recipe.title = title
-                        recipes.append(recipe)
-                        success = True
-                        break
-
-                    except Exception as e:
-                        if attempt < 2:
-                            page.wait_for_timeout(2000)  # Wait before retry
-                        else:
-                            if args.debug:
-                                console.print(
-                                    f"[red]Failed to scrape {title}: {e}[/red]"
-                                )
-                            failed.append((title, url))
+    # PHASE 2: Scrape the recipe URLs across a pool of pages
+    console.print(f"\n[cyan]Phase 2: Scraping {len(recipe_urls)} recipes...[/cyan]")
 
-                progress.advance(task)
+    with make_progress() as progress:
+        recipes, failed = asyncio.run(scrape_recipe_urls(recipe_urls, args, progress))
 
-        if recipes:
-            save_recipes(recipes, args.output)
-            console.print(f"\n[green]✓ Scraped {len(recipes)} recipes![/green]")
+    if recipes:
+        save_recipes(recipes, args.output)
+        clear_checkpoint(args.output)
+        console.print(f"\n[green]✓ Scraped {len(recipes)} recipes![/green]")
 
-        if failed:
-            console.print(f"[yellow]Failed to scrape {len(failed)} recipes[/yellow]")
-            # Save failed URLs to a file so user can retry
-            with open("failed_recipes.txt", "w") as f:
-                for title, url in failed:
-                    f.write(f"{url}\n")
-            console.print("[dim]Failed URLs saved to failed_recipes.txt[/dim]")
-
-        # Save updated state
-        save_state(context)
-        browser.close()
+    if failed:
+        console.print(f"[yellow]Failed to scrape {len(failed)} recipes[/yellow]")
+        # Save failed URLs to a file so user can retry
+        with open("failed_recipes.txt", "w") as f:
+            for title, url in failed:
+                f.write(f"{url}\n")
+        console.print("[dim]Failed URLs saved to failed_recipes.txt[/dim]")
 
 
 def list_all_titles(args):
@@ -504,59 +1091,43 @@ def list_all_titles(args):
     console = Console()
 
     with sync_playwright() as p:
-        browser = get_browser(p, headless=not args.visible)
+        browser = connect_or_launch_cdp(p, headless=not args.visible)
         context = get_context(browser)
         page = context.new_page()
 
-        saves_page_url = (
-            "https://www.foodnetwork.com/saves#/?section=recipes&sort=newest"
-        )
-
         console.print("[cyan]Loading saves page...[/cyan]")
         try:
-            page.goto(saves_page_url, wait_until="domcontentloaded", timeout=15000)
+            page.goto(SAVES_PAGE_URL, wait_until="domcontentloaded", timeout=15000)
         except Exception as e:
             console.print(f"[red]Navigation issue: {e}[/red]")
-            browser.close()
+            release_browser(browser, page)
             sys.exit(1)
 
-        page.wait_for_timeout(3000)
+        wait_for_cards(page)
 
         if "login" in page.url.lower() or "sign-in" in page.url.lower():
             console.print(
                 "[yellow]Redirected to login - session may have expired.[/yellow]"
             )
-            browser.close()
+            release_browser(browser, page)
             sys.exit(1)
 
         all_titles = set()
         no_new_count = 0
-        scroll_position = 0
 
         console.print("[cyan]Scrolling through all recipes to collect titles...[/cyan]")
 
-        while no_new_count < 15:  # More patient scrolling
+        while no_new_count < 5:  # Each empty pass already waited 3s
             # Scroll down
-            scroll_position += 600
-            page.evaluate(f"window.scrollTo(0, {scroll_position})")
-            page.wait_for_timeout(800)
+            scroll_saves_page(page)
 
-            # Find all cards and extract titles
-            cards = page.query_selector_all(".cards__card-link")
+            # Read all card titles in a single round trip
             new_found = 0
 
-            for card in cards:
-                title_elem = card.query_selector(".card__title, h2")
-                if title_elem:
-                    title_text = title_elem.inner_text().strip()
-                    if (
-                        title_text
-                        and "Import" not in title_text
-                        and "Create" not in title_text
-                    ):
-                        if title_text not in all_titles:
-                            all_titles.add(title_text)
-                            new_found += 1
+            for title_text, _ in read_saved_cards(page):
+                if title_text not in all_titles:
+                    all_titles.add(title_text)
+                    new_found += 1
 
             if new_found == 0:
                 no_new_count += 1
@@ -578,7 +1149,7 @@ def list_all_titles(args):
 
         console.print(f"[green]Saved to {args.output}[/green]")
 
-        browser.close()
+        release_browser(browser, page)
 
 
 def scrape_missing(args):
@@ -598,105 +1169,61 @@ def scrape_missing(args):
         f"[cyan]Searching for {len(missing_titles)} missing recipes...[/cyan]"
     )
 
+    # One display for the search and scrape phases, one task each
+    progress = make_progress()
+
     with sync_playwright() as p:
-        browser = get_browser(p, headless=not args.visible)
+        browser = connect_or_launch_cdp(p, headless=not args.visible)
         context = get_context(browser)
         page = context.new_page()
 
-        # Capture URLs when clicking cards
-        captured_url = []
-
-        def handle_request(request):
-            url = request.url
-            if "/recipes/" in url and "foodnetwork.com" in url:
-                captured_url.append(url)
-
-        page.on("request", handle_request)
-
-        saves_page_url = (
-            "https://www.foodnetwork.com/saves#/?section=recipes&sort=newest"
-        )
-
         console.print("[cyan]Loading saves page...[/cyan]")
-        page.goto(saves_page_url, wait_until="domcontentloaded", timeout=15000)
-        page.wait_for_timeout(4000)
+        page.goto(SAVES_PAGE_URL, wait_until="domcontentloaded", timeout=15000)
+        wait_for_cards(page)
 
         if "login" in page.url.lower() or "sign-in" in page.url.lower():
             console.print("[yellow]Session expired. Run 'login' first.[/yellow]")
-            browser.close()
+            release_browser(browser, page)
             sys.exit(1)
 
-        # Use the search feature on saves page
+        # One harvest pass over the whole saves list answers most lookups
+        console.print("[cyan]Collecting recipe URLs...[/cyan]")
+        urls_by_title = {
+            title.lower(): url
+            for url, title in collect_all_saved_urls(page).items()
+        }
+
         recipe_urls = []  # (title, url) tuples
+        not_harvested = []
+        for title in missing_titles:
+            url = urls_by_title.get(title.lower())
+            if url:
+                recipe_urls.append((title, url))
+            else:
+                not_harvested.append(title)
+
+        # Fall back to the search feature for anything the harvest missed
         failed = []
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Searching...", total=len(missing_titles))
+        if not_harvested:
+            with progress:
+                task = progress.add_task("Searching...", total=len(not_harvested))
 
-            for title in missing_titles:
-                progress.update(task, description=f"Searching: {title[:30]}...")
+                for title in not_harvested:
+                    progress.update(task, description=f"Searching: {title[:30]}...")
 
-                try:
-                    # Go to saves page fresh for each search
-                    page.goto(
-                        saves_page_url, wait_until="domcontentloaded", timeout=15000
-                    )
-                    page.wait_for_timeout(2000)
+                    try:
+                        url = search_saved_url(page, title)
+                    except PlaywrightError as e:
+                        log.debug("Search error for %s: %r", title, e)
+                        url = None
 
-                    # Click the search icon to reveal search input
-                    search_icon = page.query_selector(
-                        '.actions--right__search-icon, [class*="search-icon"]'
-                    )
-                    if search_icon:
-                        search_icon.click()
-                        page.wait_for_timeout(800)
-
-                    # Find and use the search input
-                    search_input = page.query_selector("#search, input.search__input")
-                    if search_input:
-                        search_input.fill(title)
-                        page.wait_for_timeout(1500)  # Wait for filter
-
-                        # Find matching card
-                        cards = page.query_selector_all(".cards__card-link")
-                        found = False
-
-                        for card in cards:
-                            title_elem = card.query_selector(".card__title, h2")
-                            if title_elem:
-                                card_title = title_elem.inner_text().strip()
-                                if (
-                                    card_title
-                                    and "Import" not in card_title
-                                    and "Create" not in card_title
-                                ):
-                                    # Check if title matches (case insensitive)
-                                    if card_title.lower() == title.lower():
-                                        captured_url.clear()
-                                        card.click()
-                                        page.wait_for_timeout(800)
-                                        if captured_url:
-                                            recipe_urls.append((title, captured_url[0]))
-                                            found = True
-                                        break
-
-                        if not found:
-                            failed.append(title)
+                    if url:
+                        recipe_urls.append((title, url))
                     else:
                         failed.append(title)
 
-                except Exception as e:
-                    if args.debug:
-                        console.print(f"[yellow]Error with {title}: {e}[/yellow]")
-                    failed.append(title)
-
-                progress.advance(task)
+                    progress.advance(task)
 
         console.print(
             f"\n[green]Found {len(recipe_urls)} of {len(missing_titles)} recipes![/green]"
@@ -704,49 +1231,27 @@ def scrape_missing(args):
 
         if not recipe_urls:
             console.print("[yellow]No recipes found.[/yellow]")
-            browser.close()
+            release_browser(browser, page)
             sys.exit(1)
 
-        # Phase 2: Scrape each found URL
-        console.print(f"\n[cyan]Scraping {len(recipe_urls)} recipes...[/cyan]")
-        recipes = []
-        scrape_failed = []
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Scraping...", total=len(recipe_urls))
-
-            for title, url in recipe_urls:
-                progress.update(task, description=f"Scraping: {title[:30]}...")
-                try:
-                    page.goto(url, wait_until="load", timeout=30000)
-                    page.wait_for_timeout(2000)
-                    recipe = extract_recipe_from_page(page, url)
-                    recipe.title = title
-                    recipes.append(recipe)
-                except Exception as e:
-                    if args.debug:
-                        console.print(f"[red]Error scraping {title}: {e}[/red]")
-                    scrape_failed.append(title)
-                progress.advance(task)
+        release_browser(browser, page)
 
-        if recipes:
-            save_recipes(recipes, args.output)
-            console.print(f"\n[green]✓ Scraped {len(recipes)} recipes![/green]")
+    # Phase 2: Scrape each found URL across a pool of pages
+    console.print(f"\n[cyan]Scraping {len(recipe_urls)} recipes...[/cyan]")
+    with progress:
+        recipes, _ = asyncio.run(scrape_recipe_urls(recipe_urls, args, progress))
 
-        if failed:
-            console.print(f"\n[yellow]Could not find {len(failed)} recipes:[/yellow]")
-            for title in failed[:10]:
-                console.print(f"  [dim]• {title}[/dim]")
-            if len(failed) > 10:
-                console.print(f"  [dim]... and {len(failed) - 10} more[/dim]")
+    if recipes:
+        save_recipes(recipes, args.output)
+        clear_checkpoint(args.output)
+        console.print(f"\n[green]✓ Scraped {len(recipes)} recipes![/green]")
 
-        browser.close()
+    if failed:
+        console.print(f"\n[yellow]Could not find {len(failed)} recipes:[/yellow]")
+        for title in failed[:10]:
+            console.print(f"  [dim]• {title}[/dim]")
+        if len(failed) > 10:
+            console.print(f"  [dim]... and {len(failed) - 10} more[/dim]")
 
 
 def main():
@@ -788,6 +1293,18 @@ def main():
     saved_parser.add_argument(
         "--debug", "-d", action="store_true", help="Show debug info"
     )
+    saved_parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Recipe pages to scrape at once",
+    )
+    saved_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-scrape every recipe, ignoring the cache and any checkpoint",
+    )
     saved_parser.set_defaults(func=scrape_saved)
 
     # List titles command (diagnostic)
@@ -818,6 +1335,18 @@ def main():
     missing_parser.add_argument(
         "--debug", "-d", action="store_true", help="Show debug info"
     )
+    missing_parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Recipe pages to scrape at once",
+    )
+    missing_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-scrape every recipe, ignoring the cache and any checkpoint",
+    )
     missing_parser.set_defaults(func=scrape_missing)
 
     args = parser.parse_args()
@@ -826,6 +1355,13 @@ def main():
         parser.print_help()
         sys.exit(1)
 
+    # Per-recipe errors are only worth formatting when --debug asks for them
+    logging.basicConfig(
+        format="%(message)s",
+        handlers=[RichHandler(console=console, show_path=False)],
+    )
+    log.setLevel(logging.DEBUG if getattr(args, "debug", False) else logging.WARNING)
+
     console.print(
         Panel.fit(
             "[bold]Food Network Recipe Scraper[/bold]\n[dim]Browser-based version[/dim]",
@@ -10,14 +10,23 @@ Usage:
 
 Output:
     Creates 'pams-recipes.html' in the current directory
+
+Builds are skipped when none of the inputs changed since the last one;
+delete .build-cache.json to force a rebuild.
 """
 
-import json
 import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+import orjson
+import rcssmin
+import rjsmin
+import xxhash
+
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 JSON_PATH = SCRIPT_DIR / "output" / "all_recipes_final.json"
@@ -27,60 +36,120 @@ OUTPUT_PATH = SCRIPT_DIR / "pams-recipes.html"
 DOCS_PATH = SCRIPT_DIR / "docs" / "index.html"  # For GitHub Pages
 IMAGES_DIR = SCRIPT_DIR / "images"
 DOCS_IMAGES_DIR = SCRIPT_DIR / "docs" / "images"
+BUILD_CACHE_PATH = SCRIPT_DIR / ".build-cache.json"
+
+# Runs of UTF-8 encoded characters json.dumps(ensure_ascii=True) would
+# have escaped - multi-byte sequences never contain ASCII bytes
+NON_ASCII_RE = re.compile(rb'[\x80-\xff]+')
+
+
+def hash_build_inputs():
+    """Hash everything the built HTML depends on."""
+    h = xxhash.xxh64()
+    for path in (JSON_PATH, CSS_PATH, JS_PATH, Path(__file__)):
+        h.update(path.read_bytes())
+    # Which local images exist decides each recipe's image_url
+    if IMAGES_DIR.exists():
+        h.update('\n'.join(sorted(os.listdir(IMAGES_DIR))).encode('utf-8'))
+    return h.hexdigest()
+
+
+def is_build_current(inputs_hash):
+    """Check whether the last build was made from the same inputs."""
+    if not (OUTPUT_PATH.exists() and DOCS_PATH.exists() and BUILD_CACHE_PATH.exists()):
+        return False
+    try:
+        return orjson.loads(BUILD_CACHE_PATH.read_bytes()).get('hash') == inputs_hash
+    except orjson.JSONDecodeError:
+        return False
 
 
 def load_recipes():
     """Load recipes from JSON file."""
-    with open(JSON_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return orjson.loads(JSON_PATH.read_bytes())
+
+
+def escape_non_ascii(match):
+    """Escape UTF-8 characters as \\uXXXX (a surrogate pair above U+FFFF)."""
+    escaped = []
+    for char in match.group().decode('utf-8'):
+        code = ord(char)
+        if code > 0xFFFF:
+            code -= 0x10000
+            escaped.append('\\u%04x\\u%04x' % (0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF)))
+        else:
+            escaped.append('\\u%04x' % code)
+    return ''.join(escaped).encode('ascii')
 
 
 def prepare_recipes_for_web(recipes):
     """
-    Prepare recipes for the web app.
+    Prepare recipes for the web app, in place.
     Uses local images when available, falls back to URLs.
     """
-    prepared = []
     local_images_used = 0
     
-    for recipe in recipes:
-        r = recipe.copy()
-        
-        # Check if we have a local image
+    # One directory read instead of a stat per recipe
+    available = {e.name for e in os.scandir(IMAGES_DIR)} if IMAGES_DIR.exists() else set()
+    
+    for r in recipes:
+        # Check if we have a local image (download_images saves them as images/<name>)
         local_path = r.get('local_image_path')
-        if local_path and (SCRIPT_DIR / local_path).exists():
+        if local_path and local_path.startswith('images/') and local_path[7:] in available:
             # For GitHub Pages, images will be in same directory
-            r['image_url'] = local_path.replace('images/', 'images/')
+            r['image_url'] = local_path
             local_images_used += 1
         # Otherwise keep the original image_url (or None)
-        
-        prepared.append(r)
     
-    return prepared, local_images_used
+    return recipes, local_images_used
+
+
+def link_or_copy(src, dst):
+    """
+    Put src (a path or os.DirEntry) at dst as a hard link - a real copy
+    across filesystems.
+    Returns False if dst is already up to date.
+    """
+    try:
+        src_stat, dst_stat = src.stat(), dst.stat()
+        if (dst_stat.st_size == src_stat.st_size
+                and dst_stat.st_mtime_ns == src_stat.st_mtime_ns):
+            return False
+    except FileNotFoundError:
+        pass
+
+    # Build next to dst and swap it in, so a changed image replaces the old one
+    tmp = dst.with_name(dst.name + '.tmp')
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copy2(src, tmp)
+    os.replace(tmp, dst)
+    return True
 
 
 def copy_images_to_docs():
-    """Copy images to docs folder for GitHub Pages."""
+    """Copy new or changed images to docs folder for GitHub Pages."""
     if not IMAGES_DIR.exists():
         return 0
     
     # Create docs/images directory
     DOCS_IMAGES_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Copy all images
-    count = 0
-    for img_file in IMAGES_DIR.glob('*'):
-        if img_file.is_file():
-            shutil.copy2(img_file, DOCS_IMAGES_DIR / img_file.name)
-            count += 1
-    
-    return count
+    # Link all images - pure syscalls, so threads overlap them fine
+    img_files = [e for e in os.scandir(IMAGES_DIR) if e.is_file()]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        copied = pool.map(
+            lambda e: link_or_copy(e, DOCS_IMAGES_DIR / e.name), img_files
+        )
+        return sum(copied)
 
 
 def load_css():
-    """Load CSS file."""
+    """Load CSS file, minified."""
     with open(CSS_PATH, 'r', encoding='utf-8') as f:
-        return f.read()
+        return rcssmin.cssmin(f.read())
 
 
 def load_js():
@@ -90,13 +159,18 @@ def load_js():
 
 
 def create_embedded_js(recipes, original_js):
-    """Create JS that uses embedded recipe data."""
+    """
+    Create JS that uses embedded recipe data.
+    Returns it as a list of UTF-8 chunks, so the (large) recipe JSON can be
+    written out as-is rather than copied into one big string.
+    """
 
-    # Serialize recipes to JSON, escaping for safe embedding in <script> tags
-    # Use ensure_ascii=True to convert unicode to \uXXXX escapes
-    recipes_json = json.dumps(recipes, ensure_ascii=True)
-    # Escape any </script> that might appear in recipe content
-    recipes_json = recipes_json.replace('</script>', '<\\/script>')
+    # Serialize recipes to JSON, escaping for safe embedding in <script> tags.
+    # "</" only ever appears inside JSON strings, where "<\/" means the same
+    # thing
+    recipes_json = orjson.dumps(recipes).replace(b'</', b'<\\/')
+    # Convert unicode to \uXXXX escapes, as json.dumps(ensure_ascii=True) did
+    recipes_json = NON_ASCII_RE.sub(escape_non_ascii, recipes_json)
 
     # Replace the entire loadRecipes function with a simple synchronous version
     # This is more compatible with iOS Safari when opening local HTML files
@@ -139,20 +213,22 @@ async function loadRecipes() {
             "allRecipes = EMBEDDED_RECIPES;"
         )
 
-    # Prepend the embedded data
-    embedded_js = f'''// Embedded recipe data ({len(recipes)} recipes)
-var EMBEDDED_RECIPES = {recipes_json};
-
-{modified_js}'''
-
-    return embedded_js
+    # Minify only now - the replacements above need the original source, and
+    # the recipe JSON is compact already
+    modified_js = rjsmin.jsmin(modified_js)
 
+    # Prepend the embedded data
+    return [
+        f'// Embedded recipe data ({len(recipes)} recipes)\nvar EMBEDDED_RECIPES = '.encode('utf-8'),
+        recipes_json,
+        b';\n\n',
+        modified_js.encode('utf-8'),
+    ]
 
-def build_html(css, js, recipe_count):
-    """Build the complete HTML file."""
-    build_date = datetime.now().strftime("%B %d, %Y")
 
-    return f'''<!DOCTYPE html>
+# The page around the inlined CSS and JS - split so each piece can be
+# written straight out instead of formatted into one big string
+HTML_HEAD = b'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -162,7 +238,9 @@ def build_html(css, js, recipe_count):
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link href="https://fonts.googleapis.com/css2?family=Cormorant+Garamond:ital,wght@0,400;0,600;0,700;1,400&family=DM+Sans:ital,wght@0,400;0,500;0,700;1,400&display=swap" rel="stylesheet">
     <style>
-{css}
+'''
+
+HTML_MIDDLE = '''
     </style>
 </head>
 <body>
@@ -216,16 +294,50 @@ def build_html(css, js, recipe_count):
     <!-- Built: {build_date} | Recipes: {recipe_count} -->
 
     <script>
-{js}
+'''
+
+HTML_TAIL = b'''
     </script>
 </body>
 </html>'''
 
 
+def build_html(css, js_chunks, recipe_count):
+    """Build the complete HTML file as a list of UTF-8 chunks."""
+    build_date = datetime.now().strftime("%B %d, %Y")
+    middle = HTML_MIDDLE.format(build_date=build_date, recipe_count=recipe_count)
+
+    return [
+        HTML_HEAD,
+        css.encode('utf-8'),
+        middle.encode('utf-8'),
+        *js_chunks,
+        HTML_TAIL,
+    ]
+
+
+def write_outputs(chunks, *paths):
+    """Write the HTML chunks to every output path in one pass."""
+    files = [open(path, 'wb') for path in paths]
+    try:
+        for chunk in chunks:
+            for f in files:
+                f.write(chunk)
+    finally:
+        for f in files:
+            f.close()
+
+
 def main():
     print("🍳 Building Pam's Recipe Collection...")
     print()
 
+    inputs_hash = hash_build_inputs()
+    if is_build_current(inputs_hash):
+        print("✅ Nothing changed since the last build - skipping")
+        print()
+        return
+
     # Load resources
     print("📖 Loading recipes...")
     recipes = load_recipes()
@@ -244,25 +356,21 @@ def main():
     js = load_js()
 
     print("📦 Bundling application...")
-    embedded_js = create_embedded_js(prepared_recipes, js)
-    html = build_html(css, embedded_js, recipe_count)
+    js_chunks = create_embedded_js(prepared_recipes, js)
+    html_chunks = build_html(css, js_chunks, recipe_count)
 
-    # Write output
-    print(f"💾 Writing to {OUTPUT_PATH.name}...")
-    with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
-        f.write(html)
-
-    # Also write to docs folder for GitHub Pages
+    # Write output, and also to docs folder for GitHub Pages
     DOCS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    print(f"💾 Writing to docs/index.html (for GitHub Pages)...")
-    with open(DOCS_PATH, 'w', encoding='utf-8') as f:
-        f.write(html)
+    print(f"💾 Writing to {OUTPUT_PATH.name} and docs/index.html (for GitHub Pages)...")
+    write_outputs(html_chunks, OUTPUT_PATH, DOCS_PATH)
 
     # Copy images to docs folder
     if IMAGES_DIR.exists():
         print("🖼️  Copying images to docs/images/...")
         img_count = copy_images_to_docs()
-        print(f"   Copied {img_count} images")
+        print(f"   Copied {img_count} new or changed images")
+
+    BUILD_CACHE_PATH.write_bytes(orjson.dumps({'hash': inputs_hash}))
 
     # Get file size
     file_size = OUTPUT_PATH.stat().st_size
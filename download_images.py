@@ -11,26 +11,47 @@ Usage:
 This will:
 1. Download images to images/ folder
 2. Update output/all_recipes_final.json with local paths
-3. Create a backup of the original JSON
+3. Create a backup of the original JSON (when anything was downloaded)
 """
 
-import json
+import asyncio
+import mmap
 import os
 import re
-import hashlib
 import shutil
 from pathlib import Path
 from urllib.parse import urlparse
-import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import httpx
+import orjson
+import xxhash
+from rich.progress import (
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    BarColumn,
+    TaskProgressColumn,
+)
 from datetime import datetime
 
+from scraper import write_json
+
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 JSON_PATH = SCRIPT_DIR / "output" / "all_recipes_final.json"
 IMAGES_DIR = SCRIPT_DIR / "images"
 BACKUP_DIR = SCRIPT_DIR / "output" / "backups"
 
+# slugify() patterns
+SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+SLUG_SPACES_RE = re.compile(r'[\s_]+')
+
+# Images in flight at once - they multiplex over a few HTTP/2 connections
+DOWNLOAD_CONCURRENCY = 32
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+
 
 def slugify(text):
     """Convert text to a URL-friendly slug."""
@@ -39,9 +60,9 @@ def slugify(text):
     # Convert to lowercase
     text = text.lower()
     # Replace special characters with hyphens
-    text = re.sub(r'[^\w\s-]', '', text)
+    text = SLUG_STRIP_RE.sub('', text)
     # Replace whitespace with hyphens
-    text = re.sub(r'[\s_]+', '-', text)
+    text = SLUG_SPACES_RE.sub('-', text)
     # Remove leading/trailing hyphens
     text = text.strip('-')
     # Limit length
@@ -78,7 +99,7 @@ def get_image_extension(url, content_type=None):
     return '.jpg'
 
 
-def download_image(recipe, images_dir):
+async def download_image(client, recipe, images_dir):
     """Download a single image and return the local path."""
     url = recipe.get('image_url')
     title = recipe.get('title', 'unknown')
@@ -90,13 +111,11 @@ def download_image(recipe, images_dir):
     slug = slugify(title)
     
     # Add hash of URL to handle duplicates with same title
-    url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+    url_hash = xxhash.xxh3_64_hexdigest(url)[:8]
     
     try:
         # Download the image
-        response = requests.get(url, timeout=30, headers={
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        response = await client.get(url)
         response.raise_for_status()
         
         # Determine extension
@@ -107,19 +126,63 @@ def download_image(recipe, images_dir):
         filename = f"{slug}-{url_hash}{ext}"
         filepath = images_dir / filename
         
-        # Save the image
-        with open(filepath, 'wb') as f:
-            f.write(response.content)
+        # Save the image, off the event loop
+        await asyncio.to_thread(filepath.write_bytes, response.content)
         
         # Return relative path for JSON
         return f"images/{filename}", None
         
-    except requests.exceptions.RequestException as e:
-        return None, str(e)
     except Exception as e:
         return None, str(e)
 
 
+async def download_all(to_download):
+    """
+    Download images concurrently, updating each recipe as it finishes.
+    Returns (downloaded, failed) counts.
+    """
+    success_count = 0
+    fail_count = 0
+    semaphore = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+    
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=HTTP_LIMITS,
+        headers=HTTP_HEADERS,
+        follow_redirects=True,
+        timeout=30,
+    ) as client:
+        
+        async def download(recipe):
+            async with semaphore:
+                return recipe, await download_image(client, recipe, IMAGES_DIR)
+        
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+        ) as progress:
+            task = progress.add_task("Downloading...", total=len(to_download))
+            
+            for next_done in asyncio.as_completed([download(r) for r in to_download]):
+                recipe, (local_path, error) = await next_done
+                title = recipe.get('title', 'Unknown')[:40]
+                
+                if local_path:
+                    recipe['local_image_path'] = local_path
+                    recipe['original_image_url'] = recipe['image_url']  # Keep original as backup
+                    success_count += 1
+                else:
+                    fail_count += 1
+                    progress.console.print(f"   ❌ {title} - {error}")
+                
+                progress.update(task, description=title)
+                progress.advance(task)
+    
+    return success_count, fail_count
+
+
 def main():
     print("🖼️  Recipe Image Downloader")
     print("=" * 50)
@@ -127,12 +190,12 @@ def main():
     
     # Create directories
     IMAGES_DIR.mkdir(exist_ok=True)
-    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
     
     # Load recipes
     print("📖 Loading recipes...")
-    with open(JSON_PATH, 'r', encoding='utf-8') as f:
-        recipes = json.load(f)
+    with open(JSON_PATH, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as data:
+            recipes = orjson.loads(data)
     
     total = len(recipes)
     print(f"   Found {total} recipes")
@@ -142,56 +205,48 @@ def main():
     print(f"   {with_images} have image URLs")
     print()
     
-    # Backup original JSON
-    backup_name = f"all_recipes_final_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    backup_path = BACKUP_DIR / backup_name
-    print(f"💾 Backing up to {backup_name}...")
-    shutil.copy(JSON_PATH, backup_path)
-    
     # Download images
     print()
     print("⬇️  Downloading images...")
     print()
     
-    success_count = 0
-    fail_count = 0
     skip_count = 0
+    to_download = []
     
-    for i, recipe in enumerate(recipes, 1):
-        title = recipe.get('title', 'Unknown')[:40]
-        url = recipe.get('image_url')
-        
-        if not url:
+    for recipe in recipes:
+        if not recipe.get('image_url'):
             skip_count += 1
-            print(f"   [{i}/{total}] ⏭️  {title} (no URL)")
             continue
         
         # Check if already downloaded (by checking if local_image_path exists)
         existing_local = recipe.get('local_image_path')
         if existing_local and (SCRIPT_DIR / existing_local).exists():
             skip_count += 1
-            print(f"   [{i}/{total}] ✓  {title} (already downloaded)")
             continue
         
-        local_path, error = download_image(recipe, IMAGES_DIR)
+        to_download.append(recipe)
+    
+    success_count, fail_count = asyncio.run(download_all(to_download))
+    
+    # Backup original JSON and save the updated one - only if anything changed
+    if success_count:
+        print()
+        backup_name = f"all_recipes_final_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.json"
+        print(f"💾 Backing up to {backup_name}...")
+        BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(JSON_PATH, BACKUP_DIR / backup_name)
+        except OSError:
+            # No hard links here (other filesystem, not permitted) - copy
+            shutil.copy2(JSON_PATH, BACKUP_DIR / backup_name)
         
-        if local_path:
-            recipe['local_image_path'] = local_path
-            recipe['original_image_url'] = url  # Keep original as backup
-            success_count += 1
-            print(f"   [{i}/{total}] ✅ {title}")
-        else:
-            fail_count += 1
-            print(f"   [{i}/{total}] ❌ {title} - {error}")
-    
-    # Save updated JSON
-    print()
-    print("💾 Saving updated recipes...")
-    with open(JSON_PATH, 'w', encoding='utf-8') as f:
-        json.dump(recipes, f, indent=2, ensure_ascii=False)
+        print("💾 Saving updated recipes...")
+        # Same format as every other tool that writes the file, and via a new
+        # file rather than truncating the one the backup links to
+        write_json(JSON_PATH, recipes)
     
     # Calculate folder size
-    total_size = sum(f.stat().st_size for f in IMAGES_DIR.glob('*') if f.is_file())
+    total_size = sum(e.stat().st_size for e in os.scandir(IMAGES_DIR) if e.is_file())
     if total_size > 1024 * 1024:
         size_str = f"{total_size / (1024 * 1024):.1f} MB"
     else:
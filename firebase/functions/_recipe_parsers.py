@@ -0,0 +1,303 @@
+"""
+Recipe extraction helpers for the scrape_recipe function
+
+Finds a recipe in a fetched page - from its JSON-LD structured data when
+it has any, otherwise from common recipe-plugin HTML patterns.
+"""
+
+import re
+
+import orjson
+from lxml import etree
+
+
+# JSON-LD blocks, found with one regex pass over the raw page - no need to
+# build a parse tree at all when the page has structured data
+JSON_LD_RE = re.compile(
+    rb'<script[^>]+type=["\']?application/ld\+json["\']?[^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Line breaks between steps when recipeInstructions is one big string
+STEP_SPLIT_RE = re.compile(r"(?:\r?\n)+")
+
+# JSON-LD Recipe properties copied straight into our format
+RECIPE_TEXT_FIELDS = {
+    "description": "description",
+    "prepTime": "prep_time",
+    "cookTime": "cook_time",
+    "totalTime": "total_time",
+}
+
+# schema.org NutritionInformation property -> label
+NUTRITION_FIELDS = {
+    "calories": "Calories",
+    "fatContent": "Fat",
+    "saturatedFatContent": "Saturated Fat",
+    "cholesterolContent": "Cholesterol",
+    "sodiumContent": "Sodium",
+    "carbohydrateContent": "Carbohydrates",
+    "fiberContent": "Fiber",
+    "sugarContent": "Sugar",
+    "proteinContent": "Protein",
+}
+
+
+def _has_class(name: str) -> str:
+    """XPath test matching the CSS class selector .name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _inside(tag: str, name: str) -> str:
+    """XPath test matching the CSS selector .name tag"""
+    return f"self::{tag} and ancestor::*[{_has_class(name)}]"
+
+
+def compile_selectors(*tests: str):
+    """
+    Compile a prioritised list of per-element XPath tests into one walk
+    over the tree that finds every candidate, plus a check per test to
+    sort the candidates back out by priority.
+    """
+    walk = etree.XPath("//*[" + " or ".join(f"({test})" for test in tests) + "]")
+    checks = tuple(etree.XPath(f"boolean(self::*[{test}])") for test in tests)
+    return walk, checks
+
+
+# Fallback HTML selectors, compiled once per container. Within each group
+# the first test that matches anything wins.
+TITLE_SELECTORS = compile_selectors(
+    f"self::h1 and {_has_class('recipe-title')}",
+    f"self::h1 and {_has_class('entry-title')}",
+    _has_class("recipe-name"),
+    "self::h1",
+)
+INGREDIENT_SELECTORS = compile_selectors(
+    _has_class("wprm-recipe-ingredient"),
+    _inside("li", "tasty-recipes-ingredients"),
+    "@itemprop='recipeIngredient'",
+    _inside("li", "recipe-ingredients"),
+    _inside("li", "ingredients"),
+)
+INSTRUCTION_SELECTORS = compile_selectors(
+    _has_class("wprm-recipe-instruction"),
+    _inside("li", "tasty-recipes-instructions"),
+    "@itemprop='recipeInstructions'",
+    _inside("li", "recipe-instructions"),
+    _inside("li", "instructions"),
+    _inside("li", "recipe-directions"),
+)
+IMAGE_SELECTORS = compile_selectors(
+    _inside("img", "recipe-image"),
+    _inside("img", "entry-content"),
+    "@itemprop='image'",
+    _inside("img", "post-thumbnail"),
+)
+
+
+def extract_json_ld_recipe(content: bytes, url: str) -> dict | None:
+    """Extract recipe data from JSON-LD structured data in the raw page."""
+
+    for match in JSON_LD_RE.finditer(content):
+        try:
+            data = orjson.loads(match.group(1))
+            recipe = find_recipe_in_json_ld(data)
+            if recipe:
+                return parse_json_ld_recipe(recipe, url)
+        except (ValueError, TypeError):
+            continue  # Invalid JSON, or not UTF-8
+
+    return None
+
+
+def find_recipe_in_json_ld(data) -> dict | None:
+    """Find Recipe object in JSON-LD data (handles various structures)."""
+
+    # Depth-first walk without recursion; children go on the stack reversed
+    # so the first Recipe in document order still wins
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            # Check for @type as string or list
+            type_val = node.get("@type")
+            if type_val == "Recipe" or (isinstance(type_val, list) and "Recipe" in type_val):
+                return node
+            graph = node.get("@graph")
+            if isinstance(graph, list):
+                stack.extend(reversed(graph))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+    return None
+
+
+def parse_json_ld_recipe(data: dict, url: str) -> dict:
+    """Parse a JSON-LD Recipe object into our format."""
+
+    recipe = {"title": data.get("name", "Untitled Recipe"), "url": url}
+
+    # Fields copied as-is, then fields that need parsing - either way,
+    # None values are left out
+    for key, field in RECIPE_TEXT_FIELDS.items():
+        value = data.get(key)
+        if value is not None:
+            recipe[field] = value
+
+    parsed = (
+        ("servings", parse_yield(data.get("recipeYield"))),
+        ("ingredients", parse_ingredients(data.get("recipeIngredient", []))),
+        ("instructions", parse_instructions(data.get("recipeInstructions", []))),
+        ("image_url", first_named(data.get("image"), "url")),
+        ("author", first_named(data.get("author"), "name")),
+        ("categories", parse_categories(data)),
+        ("nutrition", parse_nutrition(data.get("nutrition"))),
+    )
+    for field, value in parsed:
+        if value is not None:
+            recipe[field] = value
+
+    return recipe
+
+
+def parse_yield(yield_data) -> str | None:
+    """Parse recipe yield/servings."""
+    if not yield_data:
+        return None
+    if isinstance(yield_data, list):
+        yield_data = yield_data[0] if yield_data else None
+    return str(yield_data) if yield_data else None
+
+
+def parse_ingredients(ingredients) -> list:
+    """Parse ingredients list."""
+    if not ingredients:
+        return []
+    if isinstance(ingredients, str):
+        return [ingredients]
+    return [str(ing) for ing in ingredients if ing]
+
+
+def parse_instructions(instructions) -> list:
+    """Parse instructions list (handles HowToStep, HowToSection, strings)."""
+    if not instructions:
+        return []
+
+    result = []
+
+    if isinstance(instructions, str):
+        return [s for s in (line.strip() for line in STEP_SPLIT_RE.split(instructions)) if s]
+
+    for item in instructions:
+        if isinstance(item, str):
+            result.append(item)
+        elif isinstance(item, dict):
+            item_type = item.get("@type")
+            if item_type == "HowToStep":
+                text = item.get("text", "")
+                if text:
+                    result.append(text)
+            elif item_type == "HowToSection":
+                section_name = item.get("name", "")
+                if section_name:
+                    result.append(f"**{section_name}**")
+                for step in item.get("itemListElement", []):
+                    if isinstance(step, dict) and step.get("text"):
+                        result.append(step["text"])
+
+    return [s for s in result if s]
+
+
+def first_named(value, key: str) -> str | None:
+    """
+    Pull a string out of a JSON-LD value that may be a string, an object,
+    or a list of either - e.g. image ("url") or author ("name").
+    """
+    if not value:
+        return None
+    if isinstance(value, list):
+        value = value[0]
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return value.get(key)
+    return None
+
+
+def parse_categories(data: dict) -> list:
+    """Parse recipe categories and cuisine."""
+    categories = []
+
+    if "recipeCategory" in data:
+        cat = data["recipeCategory"]
+        if isinstance(cat, list):
+            categories.extend(cat)
+        else:
+            categories.append(cat)
+
+    if "recipeCuisine" in data:
+        cuisine = data["recipeCuisine"]
+        if isinstance(cuisine, list):
+            categories.extend(cuisine)
+        else:
+            categories.append(cuisine)
+
+    return categories if categories else None
+
+
+def parse_nutrition(nutrition_data) -> dict | None:
+    """Parse nutrition information."""
+    if not nutrition_data or not isinstance(nutrition_data, dict):
+        return None
+
+    result = {
+        label: nutrition_data[field]
+        for field, label in NUTRITION_FIELDS.items()
+        if field in nutrition_data
+    }
+
+    return result if result else None
+
+
+def first_match(selectors, tree) -> list:
+    """Return the elements matched by the highest-priority test that hits."""
+    walk, checks = selectors
+    candidates = walk(tree)
+    for check in checks:
+        items = [el for el in candidates if check(el)]
+        if items:
+            return items
+    return []
+
+
+def extract_html_recipe(tree, url: str) -> dict | None:
+    """Fallback: Extract recipe from common HTML patterns in an lxml tree."""
+
+    # Try to get title
+    title = None
+    titles = first_match(TITLE_SELECTORS, tree)
+    if titles:
+        title = titles[0].text_content().strip()
+
+    if not title:
+        return None
+
+    # Try to get ingredients
+    ingredients = [item.text_content().strip() for item in first_match(INGREDIENT_SELECTORS, tree)]
+
+    # Try to get instructions
+    instructions = [item.text_content().strip() for item in first_match(INSTRUCTION_SELECTORS, tree)]
+
+    # Try to get image
+    image_url = None
+    images = first_match(IMAGE_SELECTORS, tree)
+    if images:
+        image_url = images[0].get("src") or images[0].get("data-src")
+
+    return {
+        "title": title,
+        "url": url,
+        "ingredients": ingredients,
+        "instructions": instructions,
+        "image_url": image_url,
+    }
@@ -3,12 +3,23 @@ Firebase Cloud Functions for Pam's Recipe Collection
 Handles URL scraping for "Import from Web" feature
 """
 
-import json
+import hashlib
 import re
-from datetime import datetime
+import time
+from urllib.parse import urlsplit, urlunsplit
 
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from firebase_functions import https_fn, options
 from firebase_admin import initialize_app, firestore, auth
+from google.api_core.exceptions import AlreadyExists
+from google.cloud.firestore_v1.base_query import FieldFilter
+from lxml import etree
+from lxml import html as lxml_html
+
+from _recipe_parsers import extract_html_recipe, extract_json_ld_recipe
 
 # Initialize Firebase Admin
 app = initialize_app()
@@ -19,6 +30,51 @@ cors = options.CorsOptions(
     cors_methods=["GET", "POST", "OPTIONS"],
 )
 
+# One session per container, so warm invocations reuse pooled connections
+# (and skip rebuilding urllib3/TLS state) instead of starting from scratch
+session = requests.Session()
+session.headers.update({
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+})
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+)
+session.mount("http://", _adapter)
+session.mount("https://", _adapter)
+
+# Pay lxml's one-time parser setup here rather than on the first request
+lxml_html.fromstring("<html></html>")
+
+# Pages are read up to this size - structured data lives near the top, and
+# anything bigger isn't worth the memory
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# Cheap test for whether a page has any JSON-LD block worth scanning
+JSON_LD_MARKER_RE = re.compile(rb"application/ld\+json", re.IGNORECASE)
+
+# Recently parsed recipes by URL (oldest first), so retries and repeat
+# imports of the same page within a warm container skip the fetch and parse
+PARSE_CACHE: dict[str, tuple[float, dict]] = {}
+PARSE_CACHE_SIZE = 128
+PARSE_CACHE_TTL = 5 * 60  # seconds
+
+# Static error responses are encoded once per container rather than per call
+ERR_METHOD = orjson.dumps({"success": False, "error": "Method not allowed"})
+ERR_JSON = orjson.dumps({"success": False, "error": "Invalid JSON"})
+ERR_SIGNIN = orjson.dumps({"success": False, "error": "You must be signed in to import recipes."})
+ERR_TOKEN = orjson.dumps({"success": False, "error": "Invalid authentication token."})
+ERR_NO_URL = orjson.dumps({"success": False, "error": "Please provide a recipe URL."})
+ERR_BAD_URL = orjson.dumps({"success": False, "error": "Please provide a valid URL starting with http:// or https://"})
+ERR_TOO_LARGE = orjson.dumps({"success": False, "error": "This page is too large to import."})
+ERR_NO_RECIPE = orjson.dumps({"success": False, "error": "Could not find recipe data on this page. Try a different URL."})
+ERR_DUPLICATE = orjson.dumps({"success": False, "error": "This recipe has already been imported."})
+ERR_TIMEOUT = orjson.dumps({"success": False, "error": "The website took too long to respond. Please try again."})
+ERR_UNEXPECTED = orjson.dumps({"success": False, "error": "An unexpected error occurred. Please try again."})
+
 
 @https_fn.on_request(cors=cors)
 def scrape_recipe(req: https_fn.Request) -> https_fn.Response:
@@ -26,10 +82,6 @@ def scrape_recipe(req: https_fn.Request) -> https_fn.Response:
     Scrape a recipe from a URL and save it to Firestore.
     HTTP endpoint that handles CORS properly.
     """
-    # Import here to avoid startup timeout
-    import requests
-    from bs4 import BeautifulSoup
-
     # Handle preflight OPTIONS request
     if req.method == "OPTIONS":
         return https_fn.Response("", status=204)
@@ -37,7 +89,7 @@ def scrape_recipe(req: https_fn.Request) -> https_fn.Response:
     # Only accept POST
     if req.method != "POST":
         return https_fn.Response(
-            json.dumps({"success": False, "error": "Method not allowed"}),
+            ERR_METHOD,
             status=405,
             content_type="application/json"
         )
@@ -46,7 +98,7 @@ def scrape_recipe(req: https_fn.Request) -> https_fn.Response:
         data = req.get_json()
     except Exception:
         return https_fn.Response(
-            json.dumps({"success": False, "error": "Invalid JSON"}),
+            ERR_JSON,
             status=400,
             content_type="application/json"
         )
@@ -55,7 +107,7 @@ def scrape_recipe(req: https_fn.Request) -> https_fn.Response:
     auth_header = req.headers.get("Authorization", "")
     if not auth_header.startswith("Bearer "):
         return https_fn.Response(
-            json.dumps({"success": False, "error": "You must be signed in to import recipes."}),
+            ERR_SIGNIN,
             status=401,
             content_type="application/json"
         )
@@ -66,7 +118,7 @@ def scrape_recipe(req: https_fn.Request) -> https_fn.Response:
         user_id = decoded_token["uid"]
     except Exception as e:
         return https_fn.Response(
-            json.dumps({"success": False, "error": "Invalid authentication token."}),
+            ERR_TOKEN,
             status=401,
             content_type="application/json"
         )
@@ -75,70 +127,84 @@ def scrape_recipe(req: https_fn.Request) -> https_fn.Response:
     url = data.get("url", "").strip() if data else ""
     if not url:
         return https_fn.Response(
-            json.dumps({"success": False, "error": "Please provide a recipe URL."}),
+            ERR_NO_URL,
             status=400,
             content_type="application/json"
         )
 
-    # Validate URL
-    if not url.startswith(("http://", "https://")):
+    # Validate URL, and reduce it to one form so trivially different links
+    # to the same page share a cache entry and document ID. The page itself
+    # is fetched as submitted - some sites redirect or 404 without the
+    # trailing slash or parameters the canonical form drops.
+    submitted_url = url
+    url = canonical_url(url)
+    if not url:
         return https_fn.Response(
-            json.dumps({"success": False, "error": "Please provide a valid URL starting with http:// or https://"}),
+            ERR_BAD_URL,
             status=400,
             content_type="application/json"
         )
 
     try:
-        # Fetch the page
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        }
-
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
+        # Reuse a recent parse of the same page if this container has one
+        recipe_data = cached_recipe(url)
 
-        # Parse HTML
-        soup = BeautifulSoup(response.text, "html.parser")
+        if recipe_data is None:
+            recipe_data, truncated = scrape_page(submitted_url)
 
-        # Try to extract JSON-LD recipe data
-        recipe_data = extract_json_ld_recipe(soup, url)
+            if truncated and (not recipe_data or not recipe_data.get("title")):
+                return https_fn.Response(
+                    ERR_TOO_LARGE,
+                    status=413,
+                    content_type="application/json"
+                )
 
-        if not recipe_data:
-            # Fallback to HTML parsing
-            recipe_data = extract_html_recipe(soup, url)
+            if not recipe_data or not recipe_data.get("title"):
+                return https_fn.Response(
+                    ERR_NO_RECIPE,
+                    status=400,
+                    content_type="application/json"
+                )
 
-        if not recipe_data or not recipe_data.get("title"):
-            return https_fn.Response(
-                json.dumps({"success": False, "error": "Could not find recipe data on this page. Try a different URL."}),
-                status=400,
-                content_type="application/json"
-            )
+            recipe_data["url"] = url  # Store the canonical form
+            cache_recipe(url, recipe_data)
 
         # Add metadata
-        recipe_data["date_added"] = datetime.now().isoformat()
+        recipe_data["date_added"] = firestore.SERVER_TIMESTAMP  # Set by Firestore on write
         recipe_data["source"] = "imported"
         recipe_data["imported_by"] = user_id
 
-        # Check for duplicates
+        # Check for duplicates saved outside this function (migration,
+        # bookmarklet, manual entry), which all have random document IDs
         db = firestore.client()
-        existing = db.collection("recipes").where("url", "==", url).limit(1).get()
-        if list(existing):
+        # count() only sends back a number, not the matching document. Older
+        # documents may hold the URL as submitted rather than canonical.
+        urls = list({url, submitted_url})
+        query = db.collection("recipes").where(filter=FieldFilter("url", "in", urls)).limit(1)
+        if query.count().get()[0][0].value:
             return https_fn.Response(
-                json.dumps({"success": False, "error": "This recipe has already been imported."}),
+                ERR_DUPLICATE,
                 status=400,
                 content_type="application/json"
             )
 
-        # Save to Firestore
-        doc_ref = db.collection("recipes").add(recipe_data)
+        # Save to Firestore under an ID derived from the URL, so create()
+        # itself rejects re-imports - including two racing at once
+        doc_ref = db.collection("recipes").document(recipe_doc_id(url))
+        try:
+            doc_ref.create(recipe_data)
+        except AlreadyExists:
+            return https_fn.Response(
+                ERR_DUPLICATE,
+                status=400,
+                content_type="application/json"
+            )
 
         return https_fn.Response(
-            json.dumps({
+            orjson.dumps({
                 "success": True,
                 "recipe": {
-                    "id": doc_ref[1].id,
+                    "id": doc_ref.id,
                     "title": recipe_data.get("title"),
                 }
             }),
@@ -148,284 +214,109 @@ def scrape_recipe(req: https_fn.Request) -> https_fn.Response:
 
     except requests.exceptions.Timeout:
         return https_fn.Response(
-            json.dumps({"success": False, "error": "The website took too long to respond. Please try again."}),
+            ERR_TIMEOUT,
             status=504,
             content_type="application/json"
         )
     except requests.exceptions.RequestException as e:
         return https_fn.Response(
-            json.dumps({"success": False, "error": f"Could not access the website: {str(e)}"}),
+            orjson.dumps({"success": False, "error": f"Could not access the website: {str(e)}"}),
             status=502,
             content_type="application/json"
         )
     except Exception as e:
         print(f"Error scraping recipe: {e}")
         return https_fn.Response(
-            json.dumps({"success": False, "error": "An unexpected error occurred. Please try again."}),
+            ERR_UNEXPECTED,
             status=500,
             content_type="application/json"
         )
 
 
-def extract_json_ld_recipe(soup, url: str) -> dict | None:
-    """Extract recipe data from JSON-LD structured data."""
+def scrape_page(url: str) -> tuple[dict | None, bool]:
+    """
+    Fetch a page and extract its recipe.
+    Returns (recipe_data, truncated).
+    """
+    content, truncated = fetch_page(url)
 
-    scripts = soup.find_all("script", type="application/ld+json")
+    # A page with no JSON-LD block at all goes straight to the HTML
+    # fallback. Otherwise the fallback is only parsed if the JSON-LD has
+    # no usable recipe - never speculatively, since the work would carry
+    # on after the response, when the instance's CPU is throttled.
+    if not JSON_LD_MARKER_RE.search(content):
+        return extract_page_html_recipe(content, url), truncated
 
-    for script in scripts:
-        try:
-            data = json.loads(script.string)
-            recipe = find_recipe_in_json_ld(data)
-            if recipe:
-                return parse_json_ld_recipe(recipe, url)
-        except (json.JSONDecodeError, TypeError):
-            continue
-
-    return None
-
-
-def find_recipe_in_json_ld(data) -> dict | None:
-    """Find Recipe object in JSON-LD data (handles various structures)."""
-
-    if isinstance(data, dict):
-        # Check for @type as string or list
-        type_val = data.get("@type")
-        if type_val == "Recipe" or (isinstance(type_val, list) and "Recipe" in type_val):
-            return data
-        if "@graph" in data:
-            for item in data["@graph"]:
-                result = find_recipe_in_json_ld(item)
-                if result:
-                    return result
-    elif isinstance(data, list):
-        for item in data:
-            result = find_recipe_in_json_ld(item)
-            if result:
-                return result
-
-    return None
-
-
-def parse_json_ld_recipe(data: dict, url: str) -> dict:
-    """Parse a JSON-LD Recipe object into our format."""
-
-    recipe = {
-        "title": data.get("name", "Untitled Recipe"),
-        "url": url,
-        "description": data.get("description"),
-        "prep_time": data.get("prepTime"),
-        "cook_time": data.get("cookTime"),
-        "total_time": data.get("totalTime"),
-        "servings": parse_yield(data.get("recipeYield")),
-        "ingredients": parse_ingredients(data.get("recipeIngredient", [])),
-        "instructions": parse_instructions(data.get("recipeInstructions", [])),
-        "image_url": parse_image(data.get("image")),
-        "author": parse_author(data.get("author")),
-        "categories": parse_categories(data),
-        "nutrition": parse_nutrition(data.get("nutrition")),
-    }
-
-    # Remove None values
-    return {k: v for k, v in recipe.items() if v is not None}
-
-
-def parse_yield(yield_data) -> str | None:
-    """Parse recipe yield/servings."""
-    if not yield_data:
-        return None
-    if isinstance(yield_data, list):
-        yield_data = yield_data[0] if yield_data else None
-    return str(yield_data) if yield_data else None
-
-
-def parse_ingredients(ingredients) -> list:
-    """Parse ingredients list."""
-    if not ingredients:
-        return []
-    if isinstance(ingredients, str):
-        return [ingredients]
-    return [str(ing) for ing in ingredients if ing]
-
-
-def parse_instructions(instructions) -> list:
-    """Parse instructions list (handles HowToStep, HowToSection, strings)."""
-    if not instructions:
-        return []
-
-    result = []
-
-    if isinstance(instructions, str):
-        return [s.strip() for s in instructions.split("\n") if s.strip()]
-
-    for item in instructions:
-        if isinstance(item, str):
-            result.append(item)
-        elif isinstance(item, dict):
-            item_type = item.get("@type")
-            if item_type == "HowToStep":
-                text = item.get("text", "")
-                if text:
-                    result.append(text)
-            elif item_type == "HowToSection":
-                section_name = item.get("name", "")
-                if section_name:
-                    result.append(f"**{section_name}**")
-                for step in item.get("itemListElement", []):
-                    if isinstance(step, dict) and step.get("text"):
-                        result.append(step["text"])
-
-    return [s for s in result if s]
-
-
-def parse_image(image_data) -> str | None:
-    """Parse image URL from various formats."""
-    if not image_data:
-        return None
-    if isinstance(image_data, str):
-        return image_data
-    if isinstance(image_data, dict):
-        return image_data.get("url")
-    if isinstance(image_data, list) and image_data:
-        first = image_data[0]
-        if isinstance(first, str):
-            return first
-        if isinstance(first, dict):
-            return first.get("url")
-    return None
-
-
-def parse_author(author_data) -> str | None:
-    """Parse author from various formats."""
-    if not author_data:
+    # Try to extract JSON-LD recipe data straight from the raw page
+    recipe_data = extract_json_ld_recipe(content, url)
+    if not recipe_data:
+        recipe_data = extract_page_html_recipe(content, url)
+
+    return recipe_data, truncated
+
+
+def extract_page_html_recipe(content: bytes, url: str) -> dict | None:
+    """Parse raw page content and extract a recipe from its HTML."""
+    # lxml detects the encoding itself
+    try:
+        tree = lxml_html.fromstring(content)
+    except etree.ParserError:
+        return None  # Empty document
+    return extract_html_recipe(tree, url)
+
+
+def fetch_page(url: str) -> tuple[bytes, bool]:
+    """
+    Download a page, stopping after MAX_PAGE_BYTES.
+    Returns (content, truncated).
+    """
+    # Fail fast on a stuck connect, be patient on the body
+    with session.get(url, timeout=(5, 15), stream=True) as response:
+        response.raise_for_status()
+        content = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            content += chunk
+            if len(content) >= MAX_PAGE_BYTES:
+                return bytes(content), True
+    return bytes(content), False
+
+
+def cached_recipe(url: str) -> dict | None:
+    """Return a copy of the recipe parsed from url in the last few minutes, if any."""
+    entry = PARSE_CACHE.get(url)
+    if entry is None:
         return None
-    if isinstance(author_data, str):
-        return author_data
-    if isinstance(author_data, dict):
-        return author_data.get("name")
-    if isinstance(author_data, list) and author_data:
-        first = author_data[0]
-        if isinstance(first, str):
-            return first
-        if isinstance(first, dict):
-            return first.get("name")
-    return None
-
-
-def parse_categories(data: dict) -> list:
-    """Parse recipe categories and cuisine."""
-    categories = []
-
-    if "recipeCategory" in data:
-        cat = data["recipeCategory"]
-        if isinstance(cat, list):
-            categories.extend(cat)
-        else:
-            categories.append(cat)
-
-    if "recipeCuisine" in data:
-        cuisine = data["recipeCuisine"]
-        if isinstance(cuisine, list):
-            categories.extend(cuisine)
-        else:
-            categories.append(cuisine)
-
-    return categories if categories else None
-
-
-def parse_nutrition(nutrition_data) -> dict | None:
-    """Parse nutrition information."""
-    if not nutrition_data or not isinstance(nutrition_data, dict):
+    stored_at, recipe_data = entry
+    if time.monotonic() - stored_at > PARSE_CACHE_TTL:
+        del PARSE_CACHE[url]
         return None
+    return dict(recipe_data)
+
+
+def cache_recipe(url: str, recipe_data: dict) -> None:
+    """Remember a parsed recipe, evicting the oldest entry once the cache is full."""
+    PARSE_CACHE.pop(url, None)
+    if len(PARSE_CACHE) >= PARSE_CACHE_SIZE:
+        del PARSE_CACHE[next(iter(PARSE_CACHE))]
+    # Copy, since the handler adds per-user metadata to its own dict
+    PARSE_CACHE[url] = (time.monotonic(), dict(recipe_data))
 
-    fields = [
-        ("calories", "Calories"),
-        ("fatContent", "Fat"),
-        ("saturatedFatContent", "Saturated Fat"),
-        ("cholesterolContent", "Cholesterol"),
-        ("sodiumContent", "Sodium"),
-        ("carbohydrateContent", "Carbohydrates"),
-        ("fiberContent", "Fiber"),
-        ("sugarContent", "Sugar"),
-        ("proteinContent", "Protein"),
-    ]
-
-    result = {}
-    for field, label in fields:
-        if field in nutrition_data:
-            result[label] = nutrition_data[field]
-
-    return result if result else None
-
-
-def extract_html_recipe(soup, url: str) -> dict | None:
-    """Fallback: Extract recipe from common HTML patterns."""
-
-    # Try to get title
-    title = None
-    title_selectors = [
-        "h1.recipe-title",
-        "h1.entry-title",
-        ".recipe-name",
-        "h1",
-    ]
-    for selector in title_selectors:
-        el = soup.select_one(selector)
-        if el:
-            title = el.get_text(strip=True)
-            break
-
-    if not title:
+
+def canonical_url(url: str) -> str | None:
+    """
+    Lowercase the host, drop utm_* tracking parameters, fragments and any
+    trailing slash. Returns None for anything that isn't an http(s) URL.
+    """
+    parts = urlsplit(url)
+    if parts.scheme.lower() not in ("http", "https") or not parts.netloc:
         return None
+    query = "&".join(
+        param for param in parts.query.split("&")
+        if param and not param.startswith("utm_")
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+
 
-    # Try to get ingredients
-    ingredients = []
-    ingredient_selectors = [
-        ".wprm-recipe-ingredient",
-        ".tasty-recipes-ingredients li",
-        '[itemprop="recipeIngredient"]',
-        ".recipe-ingredients li",
-        ".ingredients li",
-    ]
-    for selector in ingredient_selectors:
-        items = soup.select(selector)
-        if items:
-            ingredients = [item.get_text(strip=True) for item in items]
-            break
-
-    # Try to get instructions
-    instructions = []
-    instruction_selectors = [
-        ".wprm-recipe-instruction",
-        ".tasty-recipes-instructions li",
-        '[itemprop="recipeInstructions"]',
-        ".recipe-instructions li",
-        ".instructions li",
-        ".recipe-directions li",
-    ]
-    for selector in instruction_selectors:
-        items = soup.select(selector)
-        if items:
-            instructions = [item.get_text(strip=True) for item in items]
-            break
-
-    # Try to get image
-    image_url = None
-    img_selectors = [
-        ".recipe-image img",
-        ".entry-content img",
-        '[itemprop="image"]',
-        ".post-thumbnail img",
-    ]
-    for selector in img_selectors:
-        el = soup.select_one(selector)
-        if el:
-            image_url = el.get("src") or el.get("data-src")
-            break
-
-    return {
-        "title": title,
-        "url": url,
-        "ingredients": ingredients,
-        "instructions": instructions,
-        "image_url": image_url,
-    }
+def recipe_doc_id(url: str) -> str:
+    """Stable Firestore document ID for a recipe imported from url."""
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
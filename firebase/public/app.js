@@ -179,7 +179,12 @@ function loadRecipes() {
         .onSnapshot((snapshot) => {
             allRecipes = [];
             snapshot.forEach((doc) => {
-                allRecipes.push({ id: doc.id, ...doc.data() });
+                const recipe = { id: doc.id, ...doc.data() };
+                // Imported recipes carry a server Timestamp; the rest use ISO strings
+                if (recipe.date_added && recipe.date_added.toDate) {
+                    recipe.date_added = recipe.date_added.toDate().toISOString();
+                }
+                allRecipes.push(recipe);
             });
             filteredRecipes = [...allRecipes];
             applyCurrentSort();
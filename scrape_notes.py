@@ -11,48 +11,182 @@ Usage:
 Options:
     --visible       Show browser window while scraping
     --limit N       Only scrape first N recipes (for testing)
+    --concurrency N Recipe pages to check at once (default: 5)
     --dry-run       Just show what would be scraped, don't modify files
 """
 
 import argparse
-import json
+import asyncio
 import sys
+from collections import defaultdict
+from itertools import zip_longest
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import urlparse
 
-from playwright.sync_api import sync_playwright
+import ijson
+import orjson
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
-from browser_scraper import get_browser, get_context, STATE_FILE
+from browser_scraper import (
+    block_resources_async,
+    connect_or_launch_cdp_async,
+    get_context_async,
+    STATE_FILE,
+)
+from scraper import write_json
 
 console = Console()
 
+# Tabs checking recipe pages at once
+DEFAULT_CONCURRENCY = 5
 
-def extract_private_notes(page) -> str | None:
+# Pages checked per browser context before it's replaced with a fresh one
+CONTEXT_ROTATE_EVERY = 200
+
+# Where the notes text may live, most specific first
+NOTE_SELECTORS = [
+    ".private-notes__note-content",
+    ".private-notes__notes p",
+    "[class*='private-notes'] p",
+    ".private-notes-body p",
+]
+NOTE_SELECTOR = ", ".join(NOTE_SELECTORS)
+
+# Text of the first selector (in priority order) with any, in one round trip
+NOTES_JS = """selectors => {
+    for (const selector of selectors) {
+        const text = document.querySelector(selector)?.innerText.trim();
+        if (text) return text;
+    }
+    return null;
+}"""
+
+
+async def extract_private_notes(page) -> str | None:
     """Extract private notes from a Food Network recipe page."""
-    # Wait a moment for dynamic content to load
-    page.wait_for_timeout(1500)
-
-    # Try multiple selectors for the notes content
-    selectors = [
-        ".private-notes__note-content",
-        ".private-notes__notes p",
-        "[class*='private-notes'] p",
-        ".private-notes-body p",
+    # The notes are rendered client-side - wait for any of them to appear,
+    # giving up after a couple of seconds on recipes that have none
+    try:
+        await page.wait_for_selector(NOTE_SELECTOR, state="attached", timeout=2000)
+    except PlaywrightTimeoutError:
+        return None
+
+    return await page.evaluate(NOTES_JS, NOTE_SELECTORS)
+
+
+def interleave_by_chef(recipes: list[dict]) -> list[dict]:
+    """
+    Reorder recipes round-robin across chefs (the first path segment after
+    /recipes/), so concurrent workers don't hit one chef's pages back to back.
+    """
+    by_chef = defaultdict(list)
+    for recipe in recipes:
+        path = urlparse(recipe["url"]).path.split("/")
+        by_chef[path[2] if len(path) > 2 else ""].append(recipe)
+
+    return [
+        recipe
+        for group in zip_longest(*by_chef.values())
+        for recipe in group
+        if recipe is not None
     ]
 
-    for selector in selectors:
-        try:
-            elem = page.query_selector(selector)
-            if elem:
-                text = elem.inner_text().strip()
-                if text and len(text) > 0:
-                    return text
-        except Exception:
-            continue
 
-    return None
+async def check_batch(context, recipes: list[dict], found: dict, concurrency: int, progress, task):
+    """
+    Check a batch of recipe pages for notes, recording hits in found.
+
+    A pool of tabs is opened once in the context; each worker owns a tab
+    and reuses it for every recipe it pulls from a shared queue, so there's
+    no page setup or teardown per URL.
+    """
+    queue = asyncio.Queue()
+    for recipe in recipes:
+        queue.put_nowait(recipe)
+
+    async def worker(page):
+        while not queue.empty():
+            recipe = queue.get_nowait()
+            url = recipe.get("url")
+            title = recipe.get("title", "Unknown")
+
+            try:
+                await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+                notes = await extract_private_notes(page)
+            except Exception as e:
+                console.print(f"[red]Error on {title}: {e}[/red]")
+                notes = None
+
+            if notes:
+                console.print(f"[green]✓ Found note for: {title}[/green]")
+                console.print(f"  [dim]{notes[:80]}{'...' if len(notes) > 80 else ''}[/dim]")
+
+                found[url] = notes
+
+            progress.advance(task)
+
+    pages = await asyncio.gather(
+        *(context.new_page() for _ in range(min(concurrency, len(recipes))))
+    )
+    try:
+        await asyncio.gather(*(worker(page) for page in pages))
+    finally:
+        for page in pages:
+            await page.close()
+
+
+async def scrape_notes(fn_recipes: list[dict], args) -> dict[str, str]:
+    """
+    Visit each recipe page and collect its private notes.
+
+    Pages are checked in batches of CONTEXT_ROTATE_EVERY. After each batch
+    the context is swapped for a fresh one on the saved login, which caps
+    the memory Playwright builds up per context (routing state included)
+    on long runs.
+
+    Returns:
+        Dict of url -> notes for the recipes that have notes
+    """
+    found = {}
+
+    async with async_playwright() as p:
+        # Attach to the persistent Chrome shared with browser_scraper.py, so
+        # there's no browser cold start and the profile is already logged in
+        browser = await connect_or_launch_cdp_async(p, headless=not args.visible)
+        # The persistent profile's own context can't be closed, only left
+        shared = bool(browser.contexts)
+        context = await get_context_async(browser)
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Scraping notes...", total=len(fn_recipes))
+
+            for start in range(0, len(fn_recipes), CONTEXT_ROTATE_EVERY):
+                if start:
+                    if shared:
+                        await context.unroute("**/*", block_resources_async)
+                    else:
+                        await context.close()
+                    context = await browser.new_context(storage_state=str(STATE_FILE))
+                    await context.route("**/*", block_resources_async)
+                    shared = False
+
+                batch = fn_recipes[start:start + CONTEXT_ROTATE_EVERY]
+                await check_batch(context, batch, found, args.concurrency, progress, task)
+
+        if not shared:
+            await context.close()
+        await browser.close()  # Only disconnects from a persistent Chrome
+
+    return found
 
 
 def main():
@@ -60,6 +194,10 @@ def main():
     parser.add_argument("--visible", action="store_true", help="Show browser window")
     parser.add_argument("--limit", type=int, help="Limit number of recipes to process")
     parser.add_argument("--dry-run", action="store_true", help="Don't modify files, just show results")
+    parser.add_argument(
+        "--concurrency", "-c", type=int, default=DEFAULT_CONCURRENCY,
+        help=f"Recipe pages to check at once (default: {DEFAULT_CONCURRENCY})",
+    )
     args = parser.parse_args()
 
     # Load existing recipes
@@ -68,17 +206,19 @@ def main():
         console.print("[red]Error: output/all_recipes_final.json not found[/red]")
         sys.exit(1)
 
-    with open(recipes_file) as f:
-        recipes = json.load(f)
+    # Stream the collection, keeping only the URL and title of the recipes
+    # to check - the full file is only loaded again to write notes back
+    total = 0
+    fn_recipes = []
+    with open(recipes_file, "rb") as f:
+        for recipe in ijson.items(f, "item"):
+            total += 1
+            url = recipe.get("url") or ""
+            # Only Food Network URLs (notes won't exist on external/saves pages)
+            if "foodnetwork.com/recipes/" in url and "/saves" not in url:
+                fn_recipes.append({"url": url, "title": recipe.get("title", "Unknown")})
 
-    console.print(f"[cyan]Loaded {len(recipes)} recipes[/cyan]")
-
-    # Filter to only Food Network URLs (notes won't exist on external/saves pages)
-    fn_recipes = [
-        r for r in recipes
-        if r.get("url") and "foodnetwork.com/recipes/" in r.get("url", "")
-        and "/saves" not in r.get("url", "")
-    ]
+    console.print(f"[cyan]Loaded {total} recipes[/cyan]")
 
     console.print(f"[cyan]Found {len(fn_recipes)} Food Network recipe URLs to check[/cyan]")
 
@@ -93,52 +233,14 @@ def main():
     if args.dry_run:
         console.print("[yellow]DRY RUN - no files will be modified[/yellow]")
 
-    # Track results
-    notes_found = []
+    found = asyncio.run(scrape_notes(interleave_by_chef(fn_recipes), args))
 
-    with sync_playwright() as p:
-        browser = get_browser(p, headless=not args.visible)
-        context = get_context(browser)
-        page = context.new_page()
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Scraping notes...", total=len(fn_recipes))
-
-            for recipe in fn_recipes:
-                url = recipe.get("url")
-                title = recipe.get("title", "Unknown")
-
-                progress.update(task, description=f"[cyan]{title[:40]}...[/cyan]")
-
-                try:
-                    page.goto(url, wait_until="domcontentloaded", timeout=15000)
-                    notes = extract_private_notes(page)
-
-                    if notes:
-                        console.print(f"[green]✓ Found note for: {title}[/green]")
-                        console.print(f"  [dim]{notes[:80]}{'...' if len(notes) > 80 else ''}[/dim]")
-
-                        notes_found.append({
-                            "title": title,
-                            "url": url,
-                            "notes": notes
-                        })
-
-                        # Update the recipe in memory
-                        recipe["private_notes"] = notes
-
-                except Exception as e:
-                    console.print(f"[red]Error on {title}: {e}[/red]")
-
-                progress.advance(task)
-
-        browser.close()
+    # Report in collection order rather than the order pages finished
+    notes_found = [
+        {"title": r.get("title", "Unknown"), "url": r["url"], "notes": found[r["url"]]}
+        for r in fn_recipes
+        if r["url"] in found
+    ]
 
     # Summary
     console.print(f"\n[bold]Summary:[/bold]")
@@ -147,14 +249,17 @@ def main():
 
     if not args.dry_run and notes_found:
         # Save updated recipes with notes
-        with open(recipes_file, "w") as f:
-            json.dump(recipes, f, indent=2)
+        recipes = orjson.loads(recipes_file.read_bytes())
+        for recipe in recipes:
+            notes = found.get(recipe.get("url"))
+            if notes:
+                recipe["private_notes"] = notes
+        write_json(recipes_file, recipes)
         console.print(f"[green]✓ Updated {recipes_file} with private_notes field[/green]")
 
         # Save separate file with just recipes that have notes
         notes_file = Path("output/recipes_with_notes.json")
-        with open(notes_file, "w") as f:
-            json.dump(notes_found, f, indent=2)
+        write_json(notes_file, notes_found)
         console.print(f"[green]✓ Created {notes_file} with {len(notes_found)} recipes[/green]")
 
     elif args.dry_run and notes_found:
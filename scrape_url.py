@@ -7,96 +7,152 @@ Usage:
 
 Or multiple URLs:
     python scrape_url.py url1 url2 url3
+
+Options:
+    --concurrency N  Recipe pages to scrape at once (default: 5)
 """
 
+import argparse
+import asyncio
 import sys
-import json
 import os
-import re
-from pathlib import Path
 from datetime import datetime
+from functools import partial
+from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from playwright.sync_api import sync_playwright
+import orjson
+from playwright.async_api import async_playwright
 from rich.console import Console
 from browser_scraper import (
-    get_browser,
-    get_context,
-    extract_recipe_from_page,
+    HTTP_CONCURRENCY,
+    connect_or_launch_cdp_async,
+    fetch_recipe,
+    make_http_client,
+    get_context_async,
+    extract_recipe_from_page_async,
+    wait_for_json_ld_async,
     STATE_FILE,
 )
-from scraper import save_recipes
+from scraper import save_recipes, slugify, write_json
 
 console = Console()
 
+# Recipe pages scraped at once, each in its own tab
+DEFAULT_CONCURRENCY = 5
+
 
 def generate_markdown(recipe):
     """Convert a recipe dict to markdown format."""
-    lines = []
     title = recipe.get("title", "Untitled Recipe")
-    lines.append(f"# {title}")
-    lines.append("")
-
-    if recipe.get("url"):
-        lines.append(f"**Source:** [{recipe['url']}]({recipe['url']})")
-        lines.append("")
-
-    if recipe.get("author"):
-        lines.append(f"**By:** {recipe['author']}")
-        lines.append("")
-
-    if recipe.get("description"):
-        lines.append(f"> {recipe['description']}")
-        lines.append("")
-
-    info = []
-    if recipe.get("prep_time"):
-        info.append(f"**Prep:** {recipe['prep_time']}")
-    if recipe.get("cook_time"):
-        info.append(f"**Cook:** {recipe['cook_time']}")
-    if recipe.get("total_time"):
-        info.append(f"**Total:** {recipe['total_time']}")
-    if recipe.get("servings"):
-        info.append(f"**Servings:** {recipe['servings']}")
-    if info:
-        lines.append(" | ".join(info))
-        lines.append("")
-
+    url = recipe.get("url")
+    author = recipe.get("author")
+    description = recipe.get("description")
     ingredients = recipe.get("ingredients", [])
-    if ingredients:
-        lines.append("## Ingredients")
-        lines.append("")
-        for ing in ingredients:
-            lines.append(f"- {ing}")
-        lines.append("")
-
     instructions = recipe.get("instructions", [])
-    if instructions:
-        lines.append("## Instructions")
-        lines.append("")
-        for i, step in enumerate(instructions, 1):
-            lines.append(f"{i}. {step}")
-            lines.append("")
-
     nutrition = recipe.get("nutrition", {})
-    if nutrition:
-        lines.append("## Nutrition")
-        lines.append("")
-        for key, value in nutrition.items():
-            lines.append(f"- **{key}:** {value}")
-        lines.append("")
 
-    return "\n".join(lines)
+    info = " | ".join(
+        f"**{label}:** {recipe[key]}"
+        for label, key in (
+            ("Prep", "prep_time"),
+            ("Cook", "cook_time"),
+            ("Total", "total_time"),
+            ("Servings", "servings"),
+        )
+        if recipe.get(key)
+    )
+
+    # One string per section, skipped when empty, blank line between each
+    sections = [
+        f"# {title}",
+        url and f"**Source:** [{url}]({url})",
+        author and f"**By:** {author}",
+        description and f"> {description}",
+        info,
+        ingredients and "## Ingredients\n\n" + "\n".join(f"- {ing}" for ing in ingredients),
+        instructions and "## Instructions\n\n" + "\n\n".join(
+            f"{i}. {step}" for i, step in enumerate(instructions, 1)
+        ),
+        nutrition and "## Nutrition\n\n" + "\n".join(
+            f"- **{key}:** {value}" for key, value in nutrition.items()
+        ),
+    ]
+
+    return "\n\n".join(filter(None, sections)) + "\n"
+
+
+def write_markdown_final(recipe, md_final_dir: Path):
+    """Write one recipe's markdown_final file."""
+    recipe_dict = recipe.__dict__ if hasattr(recipe, "__dict__") else recipe
+    title = recipe_dict.get("title", "untitled")
+    md_content = generate_markdown(recipe_dict)
+    (md_final_dir / f"{slugify(title)}.md").write_text(md_content)
+
+
+async def scrape_single_url(url: str, page):
+    """Scrape a single recipe URL and return the Recipe."""
+    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+    await wait_for_json_ld_async(page)
+    recipe = await extract_recipe_from_page_async(page, url)
+    return recipe
 
 
-def scrape_single_url(url: str, page) -> dict:
-    """Scrape a single recipe URL and return the recipe dict."""
-    page.goto(url, wait_until="load", timeout=30000)
-    page.wait_for_timeout(2000)
-    recipe = extract_recipe_from_page(page, url)
-    return recipe
+async def scrape_urls(urls: list[str], concurrency: int) -> list:
+    """
+    Scrape several recipe URLs, returning the recipes that scraped in
+    input order.
+
+    Each page is first fetched over plain HTTP with the saved session
+    cookies, which finds the JSON-LD on most recipe pages without a
+    browser. Only the rest are rendered, concurrently, each in its own tab
+    of one shared context.
+    """
+    semaphore = asyncio.Semaphore(HTTP_CONCURRENCY)
+    async with make_http_client() as client:
+        results = await asyncio.gather(
+            *(fetch_recipe(client, semaphore, url) for url in urls)
+        )
+
+    pending = []
+    for index, (url, recipe) in enumerate(zip(urls, results)):
+        if recipe:
+            console.print(f"[green]✓ {recipe.title}[/green]")
+        else:
+            pending.append((index, url))
+
+    if not pending:
+        return list(results)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with async_playwright() as p:
+        # Attach to the persistent Chrome shared with browser_scraper.py, so
+        # there's no browser cold start and the profile is already logged in
+        browser = await connect_or_launch_cdp_async(p, headless=False)
+        context = await get_context_async(browser)
+
+        async def scrape(index, url):
+            async with semaphore:
+                console.print(f"[cyan]Scraping: {url[:60]}...[/cyan]")
+                page = await context.new_page()
+                try:
+                    recipe = await scrape_single_url(url, page)
+                except Exception as e:
+                    console.print(f"[red]Failed to scrape {url}: {e}[/red]")
+                    return
+                finally:
+                    await page.close()
+
+            console.print(f"[green]✓ {recipe.title}[/green]")
+            results[index] = recipe
+
+        await asyncio.gather(*(scrape(index, url) for index, url in pending))
+        await browser.close()  # Only disconnects from a persistent Chrome
+
+    return [r for r in results if r]
 
 
 def main():
@@ -110,7 +166,15 @@ def main():
         )
         sys.exit(1)
 
-    urls = sys.argv[1:]
+    parser = argparse.ArgumentParser(description="Scrape recipe URLs into the collection")
+    parser.add_argument("urls", nargs="+", help="Recipe URLs to scrape")
+    parser.add_argument(
+        "--concurrency", "-c", type=int, default=DEFAULT_CONCURRENCY,
+        help=f"Recipe pages to scrape at once (default: {DEFAULT_CONCURRENCY})",
+    )
+    args = parser.parse_args()
+
+    urls = args.urls
     console.print(f"[cyan]Scraping {len(urls)} recipe(s)...[/cyan]")
 
     if not STATE_FILE.exists():
@@ -119,34 +183,14 @@ def main():
         )
         sys.exit(1)
 
-    with sync_playwright() as p:
-        browser = get_browser(p, headless=False)
-        context = get_context(browser)
-        page = context.new_page()
-
-        recipes = []
-        for url in urls:
-            try:
-                console.print(f"[cyan]Scraping: {url[:60]}...[/cyan]")
-                recipe = scrape_single_url(url, page)
-                recipes.append(recipe)
-                console.print(f"[green]✓ {recipe.title}[/green]")
-            except Exception as e:
-                console.print(f"[red]Failed to scrape {url}: {e}[/red]")
-
-        browser.close()
+    recipes = asyncio.run(scrape_urls(urls, args.concurrency))
 
     if recipes:
-        # Save to output directory
-        save_recipes(recipes, "output")
-
-        # Also append to the final collection
+        # Add new recipes to the final collection (dedupe by URL to allow
+        # same-title recipes by different chefs)
         final_file = Path("output/all_recipes_final.json")
         if final_file.exists():
-            with open(final_file) as f:
-                existing = json.load(f)
-
-            # Add new recipes (dedupe by URL to allow same-title recipes by different chefs)
+            existing = orjson.loads(final_file.read_bytes())
             existing_urls = {r.get("url") for r in existing}
             new_count = 0
             for recipe in recipes:
@@ -155,10 +199,10 @@ def main():
                     # Add date_added timestamp for sorting by "Newest"
                     recipe_dict["date_added"] = datetime.now().isoformat()
                     existing.append(recipe_dict)
+                    existing_urls.add(recipe_dict.get("url"))
                     new_count += 1
 
-            with open(final_file, "w") as f:
-                json.dump(existing, f, indent=2)
+            write_json(final_file, existing)
 
             console.print(
                 f"\n[green]✓ Added {new_count} new recipe(s) to all_recipes_final.json[/green]"
@@ -167,20 +211,14 @@ def main():
                 f"[green]  Total recipes in collection: {len(existing)}[/green]"
             )
 
-        # Also save to markdown_final
+        # Save to output directory, writing each recipe's markdown_final
+        # copy in the same pass
         md_final_dir = Path("output/markdown_final")
+        write_extra = None
         if md_final_dir.exists():
-            for recipe in recipes:
-                recipe_dict = recipe.__dict__ if hasattr(recipe, "__dict__") else recipe
-                title = recipe_dict.get("title", "untitled")
-                # Slugify
-                slug = title.lower()
-                slug = re.sub(r"[^\w\s-]", "", slug)
-                slug = re.sub(r"[-\s]+", "-", slug).strip("-")
-
-                md_content = generate_markdown(recipe_dict)
-                with open(md_final_dir / f"{slug}.md", "w") as f:
-                    f.write(md_content)
+            write_extra = partial(write_markdown_final, md_final_dir=md_final_dir)
+        save_recipes(recipes, "output", write_extra=write_extra)
+        if write_extra:
             console.print(f"[green]✓ Added to output/markdown_final/[/green]")
 
         console.print(f"\n[green]✓ Scraped {len(recipes)} recipe(s)![/green]")
@@ -6,20 +6,97 @@ It handles authentication, recipe discovery, and data extraction.
 """
 
 import json
+import os
 import re
+import threading
 import time
-from dataclasses import dataclass, asdict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, replace
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 from urllib.parse import urljoin, urlparse
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 console = Console()
 
+# Recipes each FoodNetworkScraper keeps in memory for repeat requests
+RECIPE_CACHE_SIZE = 2048
+
+JSON_LD_XPATH = etree.XPath("//script[@type='application/ld+json']/text()")
+
+# Filename slugs keep word characters, whitespace and hyphens. Pure-ASCII
+# titles (nearly all of them) drop the rest with a translate table, which
+# is much cheaper than the regex needed for other Unicode punctuation.
+SLUG_DELETE = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c.isspace() or c in "-_")
+))
+SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+SLUG_DASH_RE = re.compile(r"[-\s]+")
+
+
+def _class_contains(*words: str) -> str:
+    """XPath test: the class attribute contains any of words, ignoring case."""
+    lowered = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    return " or ".join(f"contains({lowered}, '{word}')" for word in words)
+
+
+# HTML fallback parser queries, compiled once. Each picks the first match in
+# document order, like BeautifulSoup's find() with a class regex did.
+TITLE_XPATH = etree.XPath(f"(//h1[{_class_contains('title', 'headline')}])[1]")
+H1_XPATH = etree.XPath("(//h1)[1]")
+AUTHOR_XPATH = etree.XPath(f"(//*[{_class_contains('author', 'byline', 'chef')}])[1]")
+DESCRIPTION_XPATH = etree.XPath(
+    f"(//*[{_class_contains('description', 'summary', 'intro')}])[1]"
+)
+INGREDIENTS_XPATH = etree.XPath(
+    f"(//*[{_class_contains('ingredient')}])[1]//*[self::li or self::p or self::span]"
+)
+INSTRUCTIONS_XPATH = etree.XPath(
+    f"(//*[{_class_contains('instruction', 'direction', 'method', 'step')}])[1]"
+    "//*[self::li or self::p]"
+)
+IMAGE_XPATH = etree.XPath(f"(//img[{_class_contains('recipe', 'hero', 'main')}])[1]")
+TEXT_XPATH = etree.XPath(".//text()")
+
+PAGINATION_CLASS_RE = re.compile(r"next|pagination", re.I)
+
+
+def format_duration(time_str: Optional[str]) -> Optional[str]:
+    """
+    Convert an ISO 8601 duration (PT1H30M) to readable format (1h 30m).
+
+    Plain string scanning rather than a regex - the input is always short
+    and fixed-form. Values that aren't PT durations are returned unchanged.
+    """
+    if not time_str:
+        return None
+    if not time_str.startswith("PT"):
+        return time_str
+
+    rest = time_str[2:]
+    hours, found, tail = rest.partition("H")
+    if not found or not hours.isdigit():
+        hours, tail = "", rest
+    minutes, found, _ = tail.partition("M")
+    if not found or not minutes.isdigit():
+        minutes = ""
+
+    parts = []
+    if hours:
+        parts.append(f"{hours}h")
+    if minutes:
+        parts.append(f"{minutes}m")
+    return " ".join(parts) if parts else None
+
 
 @dataclass
 class Recipe:
@@ -52,60 +129,41 @@ class Recipe:
 
     def to_markdown(self) -> str:
         """Convert recipe to Markdown format."""
-        lines = [f"# {self.title}", ""]
-
-        if self.author:
-            lines.extend([f"**Author:** {self.author}", ""])
-
-        if self.description:
-            lines.extend([f"> {self.description}", ""])
-
-        if self.image_url:
-            lines.extend([f"![{self.title}]({self.image_url})", ""])
-
         # Time and servings info
-        info_parts = []
-        if self.prep_time:
-            info_parts.append(f"**Prep Time:** {self.prep_time}")
-        if self.cook_time:
-            info_parts.append(f"**Cook Time:** {self.cook_time}")
-        if self.total_time:
-            info_parts.append(f"**Total Time:** {self.total_time}")
-        if self.servings:
-            info_parts.append(f"**Servings:** {self.servings}")
-        if self.difficulty:
-            info_parts.append(f"**Difficulty:** {self.difficulty}")
-
-        if info_parts:
-            lines.extend([" | ".join(info_parts), ""])
-
-        if self.categories:
-            lines.extend([f"**Categories:** {', '.join(self.categories)}", ""])
-
-        # Ingredients
-        if self.ingredients:
-            lines.extend(["## Ingredients", ""])
-            for ingredient in self.ingredients:
-                lines.append(f"- {ingredient}")
-            lines.append("")
-
-        # Instructions
-        if self.instructions:
-            lines.extend(["## Instructions", ""])
-            for i, instruction in enumerate(self.instructions, 1):
-                lines.append(f"{i}. {instruction}")
-            lines.append("")
-
-        # Nutrition
-        if self.nutrition:
-            lines.extend(["## Nutrition Information", ""])
-            for key, value in self.nutrition.items():
-                lines.append(f"- **{key}:** {value}")
-            lines.append("")
+        info = " | ".join(
+            f"**{label}:** {value}"
+            for label, value in (
+                ("Prep Time", self.prep_time),
+                ("Cook Time", self.cook_time),
+                ("Total Time", self.total_time),
+                ("Servings", self.servings),
+                ("Difficulty", self.difficulty),
+            )
+            if value
+        )
 
-        lines.extend(["---", f"*Source: [{self.url}]({self.url})*"])
+        # One string per section, skipped when empty, blank line between each
+        sections = [
+            f"# {self.title}",
+            self.author and f"**Author:** {self.author}",
+            self.description and f"> {self.description}",
+            self.image_url and f"![{self.title}]({self.image_url})",
+            info,
+            self.categories and f"**Categories:** {', '.join(self.categories)}",
+            self.ingredients and "## Ingredients\n\n" + "\n".join(
+                f"- {ingredient}" for ingredient in self.ingredients
+            ),
+            self.instructions and "## Instructions\n\n" + "\n".join(
+                f"{i}. {instruction}"
+                for i, instruction in enumerate(self.instructions, 1)
+            ),
+            self.nutrition and "## Nutrition Information\n\n" + "\n".join(
+                f"- **{key}:** {value}" for key, value in self.nutrition.items()
+            ),
+            f"---\n*Source: [{self.url}]({self.url})*",
+        ]
 
-        return "\n".join(lines)
+        return "\n\n".join(filter(None, sections))
 
 
 class FoodNetworkScraper:
@@ -118,10 +176,20 @@ class FoodNetworkScraper:
         Initialize the scraper.
 
         Args:
-            delay: Seconds to wait between requests (be respectful!)
+            delay: Seconds to wait between requests to the same host (be respectful!)
         """
         self.session = requests.Session()
         self.delay = delay
+        # Enough pooled connections for scrape_recipes' worker threads
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=32)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Earliest time the next request to each host may start
+        self._next_request_at: dict[str, float] = {}
+        self._throttle_lock = threading.Lock()
+        # Scraped recipes by URL, least recently used first
+        self._recipe_cache: OrderedDict[str, Recipe] = OrderedDict()
+        self._recipe_cache_lock = threading.Lock()
         # More complete browser headers to avoid bot detection
         self.session.headers.update(
             {
@@ -139,6 +207,8 @@ class FoodNetworkScraper:
                 "Sec-Ch-Ua-Mobile": "?0",
                 "Sec-Ch-Ua-Platform": '"macOS"',
                 "Cache-Control": "max-age=0",
+                # Look like normal browsing
+                "Referer": self.BASE_URL + "/",
             }
         )
 
@@ -164,14 +234,25 @@ class FoodNetworkScraper:
             cookies = json.load(f)
         self.set_cookies(cookies)
 
-    def _get_page(
-        self, url: str, raise_on_error: bool = True
-    ) -> Optional[BeautifulSoup]:
-        """Fetch a page and return parsed BeautifulSoup object."""
+    def _wait_for_host(self, url: str):
+        """
+        Sleep until this request's turn at its host.
+
+        Each caller reserves the next slot under the lock and sleeps outside
+        it, so requests to one host start at least self.delay apart while
+        other hosts aren't held up.
+        """
+        host = urlparse(url).netloc
+        with self._throttle_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_at.get(host, now))
+            self._next_request_at[host] = start + self.delay
+        time.sleep(start - now)
+
+    def _fetch_html(self, url: str, raise_on_error: bool = True) -> Optional[str]:
+        """Fetch a page and return its HTML, or None if it couldn't be read."""
         try:
-            time.sleep(self.delay)
-            # Set referer to look like normal browsing
-            self.session.headers["Referer"] = self.BASE_URL + "/"
+            self._wait_for_host(url)
             response = self.session.get(url, timeout=30)
 
             if response.status_code == 403:
@@ -193,17 +274,30 @@ class FoodNetworkScraper:
                 console.print(f"[dim]Got status {response.status_code} for {url}[/dim]")
                 return None
 
-            return BeautifulSoup(response.text, "lxml")
+            return response.text
         except requests.RequestException as e:
             console.print(f"[red]Error fetching {url}: {e}[/red]")
             return None
 
-    def _extract_json_ld(self, soup: BeautifulSoup) -> Optional[dict]:
-        """Extract structured recipe data from JSON-LD script tags."""
-        scripts = soup.find_all("script", type="application/ld+json")
-        for script in scripts:
+    def _get_page(
+        self, url: str, raise_on_error: bool = True
+    ) -> Optional[BeautifulSoup]:
+        """Fetch a page and return parsed BeautifulSoup object."""
+        html = self._fetch_html(url, raise_on_error=raise_on_error)
+        if html is None:
+            return None
+        return BeautifulSoup(html, "lxml")
+
+    def _extract_json_ld(self, tree) -> Optional[dict]:
+        """
+        Extract structured recipe data from JSON-LD script tags.
+
+        Pulls just the script text out with one XPath and stops at the
+        first Recipe.
+        """
+        for text in JSON_LD_XPATH(tree):
             try:
-                data = json.loads(script.string)
+                data = json.loads(text)
                 # Handle both single object and array formats
                 if isinstance(data, list):
                     for item in data:
@@ -223,46 +317,80 @@ class FoodNetworkScraper:
         """
         Scrape a single recipe from its URL.
 
+        Recipes this scraper has already scraped are served from memory (as
+        a copy, so callers can modify it); failures are not remembered.
+
         Args:
             url: Full URL to the recipe page
 
         Returns:
             Recipe object or None if scraping failed
         """
+        # scrape_recipes calls this from several threads at once
+        with self._recipe_cache_lock:
+            recipe = self._recipe_cache.get(url)
+            if recipe is not None:
+                self._recipe_cache.move_to_end(url)
+                return replace(recipe)
+
+        recipe = self._scrape_recipe_uncached(url)
+        if recipe is None:
+            return None
+
+        with self._recipe_cache_lock:
+            self._recipe_cache[url] = recipe
+            self._recipe_cache.move_to_end(url)
+            if len(self._recipe_cache) > RECIPE_CACHE_SIZE:
+                self._recipe_cache.popitem(last=False)
+        return replace(recipe)
+
+    def _scrape_recipe_uncached(self, url: str) -> Optional[Recipe]:
+        """Fetch and parse a recipe page, for scrape_recipe."""
         console.print(f"[dim]Scraping: {url}[/dim]")
 
-        soup = self._get_page(url)
-        if not soup:
+        html = self._fetch_html(url)
+        if not html:
             return None
 
+        # One lxml tree serves both the JSON-LD lookup and the fallback. It's
+        # parsed from UTF-8 bytes with the encoding given explicitly, since
+        # lxml refuses a str whose <?xml ...?> prolog declares an encoding.
+        try:
+            tree = lxml_html.fromstring(
+                html.encode("utf-8"), parser=lxml_html.HTMLParser(encoding="utf-8")
+            )
+        except (etree.ParserError, ValueError):
+            return None  # Empty or unparseable document
+
         # Try to get structured data first (most reliable)
-        json_ld = self._extract_json_ld(soup)
+        json_ld = self._extract_json_ld(tree)
 
         if json_ld:
             return self._parse_json_ld(json_ld, url)
 
         # Fall back to HTML parsing
-        return self._parse_html(soup, url)
+        return self._parse_html(tree, url)
+
+    def scrape_recipes(self, urls: list[str], max_workers: int = 10) -> list[Recipe]:
+        """
+        Scrape several recipes concurrently.
+
+        Fetches overlap on a thread pool, still spaced per host by self.delay.
+
+        Args:
+            urls: Full URLs of the recipe pages
+            max_workers: Pages in flight at once
+
+        Returns:
+            Recipes that scraped successfully, in input order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.scrape_recipe, urls))
+        return [r for r in results if r]
 
     def _parse_json_ld(self, data: dict, url: str) -> Recipe:
         """Parse recipe from JSON-LD structured data."""
 
-        def get_time(time_str):
-            """Convert ISO 8601 duration to readable format."""
-            if not time_str:
-                return None
-            # Parse PT1H30M format
-            match = re.match(r"PT(?:(\d+)H)?(?:(\d+)M)?", time_str)
-            if match:
-                hours, minutes = match.groups()
-                parts = []
-                if hours:
-                    parts.append(f"{hours}h")
-                if minutes:
-                    parts.append(f"{minutes}m")
-                return " ".join(parts) if parts else None
-            return time_str
-
         def get_instructions(instructions):
             """Extract instruction text from various formats."""
             if not instructions:
@@ -361,9 +489,9 @@ class FoodNetworkScraper:
             url=url,
             author=author,
             description=data.get("description"),
-            prep_time=get_time(data.get("prepTime")),
-            cook_time=get_time(data.get("cookTime")),
-            total_time=get_time(data.get("totalTime")),
+            prep_time=format_duration(data.get("prepTime")),
+            cook_time=format_duration(data.get("cookTime")),
+            total_time=format_duration(data.get("totalTime")),
             servings=data.get("recipeYield"),
             difficulty=data.get("difficulty"),
             ingredients=get_ingredients(data.get("recipeIngredient")),
@@ -373,54 +501,41 @@ class FoodNetworkScraper:
             nutrition=nutrition,
         )
 
-    def _parse_html(self, soup: BeautifulSoup, url: str) -> Recipe:
+    def _parse_html(self, tree, url: str) -> Recipe:
         """Parse recipe from HTML when JSON-LD is not available."""
 
+        def first_text(xpath) -> Optional[str]:
+            found = xpath(tree)
+            return element_text(found[0]) if found else None
+
         # Title
-        title = "Untitled Recipe"
-        title_elem = soup.find("h1", class_=re.compile(r"title|headline", re.I))
-        if title_elem:
-            title = title_elem.get_text(strip=True)
-        elif soup.find("h1"):
-            title = soup.find("h1").get_text(strip=True)
+        title = first_text(TITLE_XPATH) or first_text(H1_XPATH) or "Untitled Recipe"
 
         # Author
-        author = None
-        author_elem = soup.find(class_=re.compile(r"author|byline|chef", re.I))
-        if author_elem:
-            author = author_elem.get_text(strip=True)
+        author = first_text(AUTHOR_XPATH)
 
         # Description
-        description = None
-        desc_elem = soup.find(class_=re.compile(r"description|summary|intro", re.I))
-        if desc_elem:
-            description = desc_elem.get_text(strip=True)
+        description = first_text(DESCRIPTION_XPATH)
 
         # Ingredients
         ingredients = []
-        ingredient_container = soup.find(class_=re.compile(r"ingredient", re.I))
-        if ingredient_container:
-            for item in ingredient_container.find_all(["li", "p", "span"]):
-                text = item.get_text(strip=True)
-                if text and len(text) > 2:
-                    ingredients.append(text)
+        for item in INGREDIENTS_XPATH(tree):
+            text = element_text(item)
+            if text and len(text) > 2:
+                ingredients.append(text)
 
         # Instructions
         instructions = []
-        instruction_container = soup.find(
-            class_=re.compile(r"instruction|direction|method|step", re.I)
-        )
-        if instruction_container:
-            for item in instruction_container.find_all(["li", "p"]):
-                text = item.get_text(strip=True)
-                if text and len(text) > 5:
-                    instructions.append(text)
+        for item in INSTRUCTIONS_XPATH(tree):
+            text = element_text(item)
+            if text and len(text) > 5:
+                instructions.append(text)
 
         # Image
         image_url = None
-        img = soup.find("img", class_=re.compile(r"recipe|hero|main", re.I))
+        img = IMAGE_XPATH(tree)
         if img:
-            image_url = img.get("src") or img.get("data-src")
+            image_url = img[0].get("src") or img[0].get("data-src")
 
         return Recipe(
             title=title,
@@ -478,7 +593,7 @@ class FoodNetworkScraper:
                             found_any = True
 
                 # Check for next page
-                next_link = soup.find("a", class_=re.compile(r"next|pagination", re.I))
+                next_link = soup.find("a", class_=PAGINATION_CLASS_RE)
                 if not next_link or not found_any:
                     break
 
@@ -521,13 +636,62 @@ class FoodNetworkScraper:
         return urls
 
 
-def save_recipes(recipes: list[Recipe], output_dir: str = "output"):
+def element_text(element) -> str:
+    """
+    An element's text with each piece stripped and run together, matching
+    BeautifulSoup's get_text(strip=True).
+    """
+    return "".join(text.strip() for text in TEXT_XPATH(element))
+
+
+def slugify(title: str) -> str:
+    """Lowercase, hyphenated filename for a recipe title."""
+    slug = title.lower()
+    if slug.isascii():
+        slug = slug.translate(SLUG_DELETE)
+    else:
+        slug = SLUG_STRIP_RE.sub("", slug)
+    return SLUG_DASH_RE.sub("-", slug).strip("-")
+
+
+def write_json(path: Path, data):
+    """
+    Write data as indented JSON, atomically - via a temp file and
+    os.replace - so an interrupted run never leaves a half-written file.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    )
+    os.replace(tmp_path, path)
+
+
+def _write_recipe_files(recipe: Recipe, json_dir: Path, markdown_dir: Path):
+    """Write one recipe's JSON and Markdown files for save_recipes."""
+    safe_name = slugify(recipe.title)[:80]  # Limit length
+
+    # Save JSON
+    json_path = json_dir / f"{safe_name}.json"
+    json_path.write_bytes(orjson.dumps(asdict(recipe), option=orjson.OPT_INDENT_2))
+
+    # Save Markdown
+    md_path = markdown_dir / f"{safe_name}.md"
+    md_path.write_text(recipe.to_markdown(), encoding="utf-8")
+
+
+def save_recipes(
+    recipes: list[Recipe],
+    output_dir: str = "output",
+    write_extra: Optional[Callable[[Recipe], None]] = None,
+):
     """
     Save recipes to JSON and Markdown files.
 
     Args:
         recipes: List of Recipe objects
         output_dir: Directory to save files
+        write_extra: Called with each recipe alongside its own files, on
+            the same thread pool, for callers that write more per recipe
     """
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
@@ -538,27 +702,18 @@ def save_recipes(recipes: list[Recipe], output_dir: str = "output"):
     json_dir.mkdir(exist_ok=True)
     markdown_dir.mkdir(exist_ok=True)
 
-    # Save each recipe
-    for recipe in recipes:
-        # Create safe filename
-        safe_name = re.sub(r"[^\w\s-]", "", recipe.title)
-        safe_name = re.sub(r"[-\s]+", "-", safe_name).strip("-").lower()
-        safe_name = safe_name[:80]  # Limit length
-
-        # Save JSON
-        json_path = json_dir / f"{safe_name}.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(asdict(recipe), f, indent=2, ensure_ascii=False)
+    # Save each recipe - file I/O releases the GIL, so the writes overlap
+    def write_one(recipe):
+        _write_recipe_files(recipe, json_dir, markdown_dir)
+        if write_extra:
+            write_extra(recipe)
 
-        # Save Markdown
-        md_path = markdown_dir / f"{safe_name}.md"
-        with open(md_path, "w", encoding="utf-8") as f:
-            f.write(recipe.to_markdown())
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(write_one, recipes))
 
     # Save combined JSON
     all_recipes_path = output_path / "all_recipes.json"
-    with open(all_recipes_path, "w", encoding="utf-8") as f:
-        json.dump([asdict(r) for r in recipes], f, indent=2, ensure_ascii=False)
+    write_json(all_recipes_path, [asdict(r) for r in recipes])
 
     console.print(f"[green]✓ Saved {len(recipes)} recipes to {output_dir}/[/green]")
     console.print(f"  - Individual JSON files: {json_dir}/")
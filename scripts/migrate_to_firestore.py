@@ -9,15 +9,32 @@ Prerequisites:
 
 Usage:
     python scripts/migrate_to_firestore.py
+
+URLs already in Firestore are cached in scripts/urls_cache.json so reruns
+only read recipes added since the last run. Delete it to force a full scan,
+e.g. after removing recipes in the app that should be migrated again.
+Likewise scripts/upload_manifest.json records the images already uploaded
+(by name and modification time), so unchanged images are skipped.
+
+Uploading images also grants public read access on the Storage bucket's
+IAM policy (see ensure_public_read), if it isn't there already.
 """
 
+import hashlib
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from threading import Lock
+
+import ijson
 
 try:
     import firebase_admin
     from firebase_admin import credentials, firestore, storage
+    from google.api_core.exceptions import PreconditionFailed
+    from google.cloud.firestore_v1.base_query import FieldFilter
 except ImportError:
     print("Please install firebase-admin: pip install firebase-admin")
     exit(1)
@@ -26,6 +43,57 @@ except ImportError:
 PROJECT_ROOT = Path(__file__).parent.parent
 RECIPES_JSON = PROJECT_ROOT / "output" / "all_recipes_final.json"
 IMAGES_DIR = PROJECT_ROOT / "images"
+URLS_CACHE = Path(__file__).parent / "urls_cache.json"
+UPLOAD_MANIFEST = Path(__file__).parent / "upload_manifest.json"
+
+# Recipe fields copied into Firestore, with their defaults
+DOC_FIELDS = (
+    ('title', 'Untitled'),
+    ('url', ''),
+    ('author', None),
+    ('description', None),
+    ('prep_time', None),
+    ('cook_time', None),
+    ('total_time', None),
+    ('servings', None),
+    ('difficulty', None),
+    ('ingredients', []),
+    ('instructions', []),
+    ('categories', []),
+    ('nutrition', {}),
+    ('image_url', None),
+    ('local_image_path', None),
+    ('date_added', None),
+)
+
+# Incremental scans reach back this far before the last sync, to allow for
+# clock skew between this machine and whoever wrote date_added
+CACHE_OVERLAP = timedelta(hours=1)
+
+# Ranges of the recipes collection read in parallel on a full scan
+SCAN_SHARDS = 16
+
+# Attempts per recipe write before the migration gives up on it
+WRITE_ATTEMPTS = 5
+
+# gRPC status code BulkWriter reports when create() finds the document
+ALREADY_EXISTS = 6
+
+# Image file extensions to upload, and their content types
+CONTENT_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.webp': 'image/webp',
+}
+
+# IAM role that makes the bucket's images publicly readable - it can read
+# an object, but not list the bucket (unlike roles/storage.objectViewer)
+PUBLIC_READ_ROLE = 'roles/storage.legacyObjectReader'
+
+# Image uploads in flight at once
+UPLOAD_WORKERS = 64
+
 
 def init_firebase():
     """Initialize Firebase Admin SDK."""
@@ -57,78 +125,180 @@ def init_firebase():
     return firestore.client(), storage.bucket()
 
 
-def migrate_recipes(db, bucket):
-    """Migrate all recipes to Firestore."""
-    # Load recipes
-    with open(RECIPES_JSON, 'r') as f:
-        recipes = json.load(f)
+def recipe_doc_id(url):
+    """Stable Firestore document ID for a recipe, as the import function uses."""
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+def iter_recipes():
+    """Yield recipes from all_recipes_final.json one at a time."""
+    with open(RECIPES_JSON, 'rb') as f:
+        yield from ijson.items(f, 'item', use_float=True)
 
-    print(f"📚 Found {len(recipes)} recipes to migrate")
 
-    # Get existing recipes to avoid duplicates
-    existing_urls = set()
-    for doc in db.collection('recipes').stream():
+def scan_urls(query):
+    """Read the url field of every recipe matched by query."""
+    urls = set()
+    for doc in query.select(['url']).stream():
         data = doc.to_dict()
         if 'url' in data:
-            existing_urls.add(data['url'])
+            urls.add(data['url'])
+    return urls
+
+
+def load_existing_urls(db):
+    """
+    Get the URLs of recipes already in Firestore, to avoid duplicates.
+
+    Starts from urls_cache.json when there is one and only reads recipes
+    added since it was written; otherwise scans the whole collection.
+    Either way only the url field is fetched, not whole documents.
+
+    Returns:
+        (set of URLs, time the scan started - to store with the cache)
+    """
+    recipes = db.collection('recipes')
+    synced_at = datetime.now(timezone.utc)
+
+    if URLS_CACHE.exists():
+        cache = json.loads(URLS_CACHE.read_text())
+        existing_urls = set(cache['urls'])
+        since = datetime.fromisoformat(cache['synced_at']) - CACHE_OVERLAP
+        # date_added is an ISO string when written by the web app and a
+        # Timestamp when set by the import function - ranges only match
+        # one type, so query for each
+        since_iso = since.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+        queries = [
+            recipes.where(filter=FieldFilter('date_added', '>', since_iso)),
+            recipes.where(filter=FieldFilter('date_added', '>', since)),
+        ]
+    else:
+        existing_urls = set()
+        # Let Firestore split the collection into ranges of document IDs
+        # that can be read side by side - a small collection comes back
+        # as a single range. Partitioning needs a collection group query;
+        # 'recipes' is only ever a top-level collection.
+        queries = [
+            partition.query()
+            for partition in db.collection_group('recipes').get_partitions(SCAN_SHARDS)
+        ]
 
+    with ThreadPoolExecutor(max_workers=SCAN_SHARDS) as pool:
+        for urls in pool.map(scan_urls, queries):
+            existing_urls |= urls
+
+    return existing_urls, synced_at
+
+
+def save_urls_cache(urls, synced_at):
+    """Write the known recipe URLs to urls_cache.json for the next run."""
+    cache = {'synced_at': synced_at.isoformat(), 'urls': sorted(urls)}
+    URLS_CACHE.write_text(json.dumps(cache, indent=2))
+
+
+def migrate_recipes(db, bucket):
+    """Migrate all recipes to Firestore."""
+    existing_urls, synced_at = load_existing_urls(db)
     print(f"📋 {len(existing_urls)} recipes already in Firestore")
 
-    batch = db.batch()
-    batch_count = 0
     migrated = 0
     skipped = 0
-
-    for i, recipe in enumerate(recipes):
-        # Skip if already exists
+    blank_url = False
+    conflicts = []
+    failed = []
+
+    def on_write_error(error, _):
+        if error.code == ALREADY_EXISTS:
+            # Written by an earlier run that stopped before saving the cache
+            conflicts.append(error)
+            return False
+        if error.attempts < WRITE_ATTEMPTS:
+            return True
+        failed.append(error)
+        return False
+
+    # BulkWriter batches the writes, sends them in parallel and ramps its
+    # rate up as Firestore keeps pace, retrying transient failures
+    recipes = db.collection('recipes')
+    bulk = db.bulk_writer()
+    bulk.on_write_error(on_write_error)
+
+    # Recipes are streamed from disk, so writes start going out before the
+    # whole file has been parsed
+    for recipe in iter_recipes():
+        # Skip if already in Firestore, or earlier in the file - merged
+        # scraping runs can repeat a recipe
         if recipe.get('url') in existing_urls:
             skipped += 1
             continue
 
-        # Prepare recipe document
+        # Prepare recipe document, leaving out missing (None) values
         doc_data = {
-            'title': recipe.get('title', 'Untitled'),
-            'url': recipe.get('url', ''),
-            'author': recipe.get('author'),
-            'description': recipe.get('description'),
-            'prep_time': recipe.get('prep_time'),
-            'cook_time': recipe.get('cook_time'),
-            'total_time': recipe.get('total_time'),
-            'servings': recipe.get('servings'),
-            'difficulty': recipe.get('difficulty'),
-            'ingredients': recipe.get('ingredients', []),
-            'instructions': recipe.get('instructions', []),
-            'categories': recipe.get('categories', []),
-            'nutrition': recipe.get('nutrition', {}),
-            'image_url': recipe.get('image_url'),
-            'local_image_path': recipe.get('local_image_path'),
-            'date_added': recipe.get('date_added'),
-            'source': 'migration',  # Mark as migrated from original collection
+            key: value
+            for key, default in DOC_FIELDS
+            if (value := recipe.get(key, default)) is not None
         }
+        doc_data['source'] = 'migration'  # Mark as migrated from original collection
+
+        # Use an ID derived from the URL, so a rerun can't duplicate a
+        # recipe - create() fails on the existing document instead
+        url = doc_data.get('url')
+        bulk.create(recipes.document(recipe_doc_id(url) if url else None), doc_data)
+        if url:
+            existing_urls.add(url)
+        elif url is not None:
+            blank_url = True
+        migrated += 1
 
-        # Remove None values
-        doc_data = {k: v for k, v in doc_data.items() if v is not None}
+        if migrated % 500 == 0:
+            print(f"   Queued {migrated} recipes...")
 
-        # Add to batch
-        doc_ref = db.collection('recipes').document()
-        batch.set(doc_ref, doc_data)
-        batch_count += 1
-        migrated += 1
+    bulk.close()  # Waits for every write to finish
 
-        # Commit batch every 500 documents (Firestore limit)
-        if batch_count >= 500:
-            print(f"   Committing batch ({migrated} recipes)...")
-            batch.commit()
-            batch = db.batch()
-            batch_count = 0
+    if failed:
+        raise RuntimeError(f"{len(failed)} recipe writes failed, first: {failed[0].message}")
 
-    # Commit remaining
-    if batch_count > 0:
-        batch.commit()
+    # Like a full scan, remember that recipes with an empty url exist - but
+    # only now, so every one of them in the file gets migrated this run
+    if blank_url:
+        existing_urls.add('')
+    save_urls_cache(existing_urls, synced_at)
 
     print(f"\n✅ Migration complete!")
-    print(f"   Migrated: {migrated}")
-    print(f"   Skipped (already exists): {skipped}")
+    print(f"   Migrated: {migrated - len(conflicts)}")
+    print(f"   Skipped (already exists): {skipped + len(conflicts)}")
+
+
+def load_upload_manifest():
+    """Get the name:mtime keys of images already in Cloud Storage."""
+    if not UPLOAD_MANIFEST.exists():
+        return set()
+    return set(json.loads(UPLOAD_MANIFEST.read_text()))
+
+
+def save_upload_manifest(manifest):
+    """Write the uploaded image keys to upload_manifest.json for the next run."""
+    UPLOAD_MANIFEST.write_text(json.dumps(sorted(manifest), indent=2))
+
+
+def ensure_public_read(bucket):
+    """
+    Let anyone read objects in the bucket, which the web app links to directly.
+
+    Note this changes the bucket's IAM policy, not just the migrated images:
+    it adds an allUsers binding for PUBLIC_READ_ROLE, which lets anyone get
+    (but not list) any object in the bucket. GCS doesn't allow IAM Conditions
+    on allUsers or on legacy roles, so the grant can't be narrowed to images/ -
+    it relies on the bucket holding only public images, as storage.rules has it.
+    """
+    policy = bucket.get_iam_policy(requested_policy_version=3)
+    for binding in policy.bindings:
+        if binding['role'] == PUBLIC_READ_ROLE and 'allUsers' in binding['members']:
+            return
+
+    policy.bindings.append({'role': PUBLIC_READ_ROLE, 'members': {'allUsers'}})
+    bucket.set_iam_policy(policy)
+    print("🔓 Granted public read access on the bucket")
 
 
 def upload_images(bucket):
@@ -137,34 +307,77 @@ def upload_images(bucket):
         print("⚠️  No images directory found, skipping image upload")
         return
 
-    images = list(IMAGES_DIR.glob("*.jpg")) + list(IMAGES_DIR.glob("*.png")) + list(IMAGES_DIR.glob("*.webp"))
-    print(f"\n📷 Found {len(images)} images to upload")
+    # One directory read, picking out files with a known image type. The
+    # DirEntry objects are used as they are - their name and path are plain
+    # strings, with no Path parsing per file.
+    with os.scandir(IMAGES_DIR) as entries:
+        images = [
+            entry for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in CONTENT_TYPES
+        ]
+    print(f"\n📷 Found {len(images)} images")
+
+    # Images uploaded by an earlier run, and unchanged since, need no
+    # requests at all
+    manifest = load_upload_manifest()
+    pending = {}
+    for entry in images:
+        key = f"{entry.name}:{entry.stat().st_mtime_ns}"
+        if key not in manifest:
+            pending[key] = entry
+
+    if not pending:
+        print(f"\n✅ All images already uploaded")
+        return
+
+    # Images are public through a bucket-wide grant rather than per object
+    ensure_public_read(bucket)
+
+    # One paged listing instead of an exists() request per image
+    remote = {blob.name for blob in bucket.list_blobs(prefix="images/", page_size=1000)}
 
     uploaded = 0
-    skipped = 0
+    lock = Lock()
 
-    for img_path in images:
-        blob_name = f"images/{img_path.name}"
-        blob = bucket.blob(blob_name)
+    def upload_one(item):
+        nonlocal uploaded
+        key, entry = item
+        blob_name = f"images/{entry.name}"
 
         # Skip if already exists
-        if blob.exists():
-            skipped += 1
-            continue
+        if blob_name in remote:
+            with lock:
+                manifest.add(key)
+            return False
+
+        blob = bucket.blob(blob_name)
 
         # Upload
-        content_type = 'image/jpeg'
-        if img_path.suffix == '.png':
-            content_type = 'image/png'
-        elif img_path.suffix == '.webp':
-            content_type = 'image/webp'
-
-        blob.upload_from_filename(str(img_path), content_type=content_type)
-        blob.make_public()  # Make image publicly accessible
-        uploaded += 1
-
-        if uploaded % 50 == 0:
-            print(f"   Uploaded {uploaded} images...")
+        content_type = CONTENT_TYPES[os.path.splitext(entry.name)[1].lower()]
+        # Only create the object if it's still absent - an image uploaded
+        # since the listing (e.g. by a concurrent run) is skipped, not replaced
+        try:
+            blob.upload_from_filename(entry.path, content_type=content_type, if_generation_match=0)
+        except PreconditionFailed:
+            with lock:
+                manifest.add(key)
+            return False
+
+        with lock:
+            manifest.add(key)
+            uploaded += 1
+            if uploaded % 50 == 0:
+                print(f"   Uploaded {uploaded} images...")
+        return True
+
+    # Each upload is an HTTPS round trip, so run many at once. The manifest
+    # is saved even if one fails, to keep the uploads that did finish.
+    try:
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+            list(pool.map(upload_one, pending.items()))
+    finally:
+        save_upload_manifest(manifest)
+    skipped = len(images) - uploaded
 
     print(f"\n✅ Image upload complete!")
     print(f"   Uploaded: {uploaded}")